@@ -14,7 +14,14 @@ from simulator_core.charger import Charger as SimCharger
 from simulator_core.evse import EVSE
 from simulator_core.store import add as store_add
 from utils.import_parsers import parse_upload
-from utils.import_validators import validate_charger_row, validate_vehicle_row
+from utils.import_validators import (
+    existing_charge_point_ids,
+    existing_vehicle_keys,
+    format_import_error,
+    ImportErrorCode,
+    validate_charger_row,
+    validate_vehicle_row,
+)
 
 router = APIRouter(tags=["import"])
 
@@ -79,11 +86,12 @@ async def import_chargers(
 
     success: list[dict] = []
     failed: list[dict] = []
+    existing_cp_ids = existing_charge_point_ids(rows, db)
 
     for raw_row in rows:
-        ok, normalized, err = validate_charger_row(raw_row, location_id, db, default_connection_url=default_url)
+        ok, normalized, code, args = validate_charger_row(raw_row, location_id, existing_cp_ids, default_connection_url=default_url)
         if not ok or normalized is None:
-            failed.append({"row": raw_row, "error": err})
+            failed.append({"row": raw_row, "error": format_import_error(code, args)})
             continue
         try:
             power_type = normalized.get("power_type", "DC")
@@ -101,8 +109,12 @@ async def import_chargers(
                 power_type=power_type,
             )
         except IntegrityError:
-            failed.append({"row": raw_row, "error": f"charger already exists with charge_point_id '{normalized['charge_point_id']}'"})
+            failed.append({
+                "row": raw_row,
+                "error": format_import_error(ImportErrorCode.DUPLICATE_CHARGE_POINT_ID, (normalized["charge_point_id"],)),
+            })
             continue
+        existing_cp_ids.add(row.charge_point_id)
         power_type = getattr(row, "power_type", "DC") or "DC"
         evses = [
             EVSE(evse_id=i, max_power_W=22000.0, power_type=power_type)
@@ -157,11 +169,12 @@ async def import_vehicles(
 
     success: list[dict] = []
     failed: list[dict] = []
+    existing_names, existing_id_tags = existing_vehicle_keys(rows, db)
 
     for raw_row in rows:
-        ok, normalized, err = validate_vehicle_row(raw_row, db)
+        ok, normalized, code, args = validate_vehicle_row(raw_row, existing_names, existing_id_tags)
         if not ok or normalized is None:
-            failed.append({"row": raw_row, "error": err})
+            failed.append({"row": raw_row, "error": format_import_error(code, args)})
             continue
         try:
             vehicle = repo_create_vehicle(
@@ -172,8 +185,10 @@ async def import_vehicles(
                 battery_capacity_kwh=normalized["battery_capacity_kwh"],
             )
         except IntegrityError:
-            failed.append({"row": raw_row, "error": "vehicle with that name or idTag already exists"})
+            failed.append({"row": raw_row, "error": format_import_error(ImportErrorCode.DUPLICATE_VEHICLE)})
             continue
+        existing_names.add(normalized["name"])
+        existing_id_tags.update(normalized["id_tags"])
         id_tags = [t.id_tag for t in vehicle.id_tags] if vehicle.id_tags else normalized["id_tags"]
         success.append(
             VehicleResponse(
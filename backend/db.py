@@ -1,15 +1,14 @@
 """Database engine and session for SQLite (dev) / PostgreSQL (prod)."""
 from collections.abc import Generator
-import os
 
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from utils.config import DATABASE_URL
+from utils.config import DATABASE_URL, is_testing
 
 # Runtime safety: when TESTING=true, never use production DB.
-if os.environ.get("TESTING") == "true":
+if is_testing():
     url = DATABASE_URL
     if "simulator.db" in url or (":memory:" not in url and "test" not in url.lower().split("?")[0]):
         raise RuntimeError(
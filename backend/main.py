@@ -34,6 +34,7 @@ from simulator_core.charging_profile import load_profiles
 from simulator_core.charger import Charger as SimCharger
 from simulator_core.evse import EVSE
 from simulator_core.store import add as store_add, seed_default
+from utils.config import is_testing
 
 app = FastAPI(
     title="OCPP Charger Simulator",
@@ -80,7 +81,7 @@ def _startup() -> None:
     _load_chargers_from_db()
 
 
-if os.environ.get("TESTING") != "true":
+if not is_testing():
     app.on_event("startup")(_startup)
 
 
@@ -0,0 +1,18 @@
+"""Helpers shared by the repositories for batched lookups."""
+from itertools import islice
+from typing import Any, Iterable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+# Values bound per IN (...) query; keeps large imports well under SQLite's host-parameter limit.
+IN_CHUNK_SIZE = 500
+
+
+def existing_values(session: Session, column: Any, values: Iterable[str], chunk_size: int = IN_CHUNK_SIZE) -> set[str]:
+    """Return the subset of values present in column, querying at most chunk_size values at a time."""
+    it = iter(set(values))
+    found: set[str] = set()
+    while chunk := list(islice(it, chunk_size)):
+        found.update(session.execute(select(column).where(column.in_(chunk))).scalars())
+    return found
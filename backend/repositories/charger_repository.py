@@ -1,11 +1,12 @@
 """Charger repository: list, get, create, update, delete."""
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from models.charger import Charger as ChargerModel
 from models.evse import Evse as EvseModel
+from repositories._batch import existing_values
 from schemas.chargers import DEFAULT_CHARGER_CONFIG, DEFAULT_METER_MEASURANDS_AC, DEFAULT_METER_MEASURANDS_DC
 
 
@@ -55,6 +56,11 @@ def get_charger_by_charge_point_id(session: Session, charge_point_id: str) -> Op
     ).scalar_one_or_none()
 
 
+def get_existing_charge_point_ids(session: Session, charge_point_ids: Iterable[str]) -> set[str]:
+    """Return the subset of charge_point_ids that already exist (one query per IN_CHUNK_SIZE ids)."""
+    return existing_values(session, ChargerModel.charge_point_id, charge_point_ids)
+
+
 def list_chargers_by_location(session: Session, location_id: str) -> list[ChargerModel]:
     """Return all chargers for a location."""
     result = session.execute(
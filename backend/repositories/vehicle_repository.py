@@ -1,11 +1,12 @@
 """Vehicle repository: list, get, create, delete."""
-from typing import Optional
+from typing import Iterable, Optional
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session, selectinload
 
 from models.vehicle import Vehicle
 from models.vehicle_id_tag import VehicleIdTag
+from repositories._batch import existing_values
 
 
 def create_vehicle(
@@ -50,6 +51,16 @@ def get_vehicle_by_name(session: Session, name: str) -> Optional[Vehicle]:
     ).scalar_one_or_none()
 
 
+def get_existing_vehicle_names(session: Session, names: Iterable[str]) -> set[str]:
+    """Return the subset of vehicle names that already exist (one query per IN_CHUNK_SIZE names)."""
+    return existing_values(session, Vehicle.name, names)
+
+
+def get_existing_id_tags(session: Session, id_tags: Iterable[str]) -> set[str]:
+    """Return the subset of idTags already assigned to a vehicle (one query per IN_CHUNK_SIZE tags)."""
+    return existing_values(session, VehicleIdTag.id_tag, id_tags)
+
+
 def list_vehicles_by_location(session: Session, location_id: str) -> list[Vehicle]:
     """Return all vehicles for a location, with id_tags loaded."""
     result = session.execute(
@@ -13,7 +13,8 @@ def main() -> int:
     REPORTS_DIR.mkdir(parents=True, exist_ok=True)
     backend_dir = Path(__file__).resolve().parent.parent
     result = subprocess.run(
-        [sys.executable, "-m", "pytest", "tests/", "-v", "--tb=short", "-m", "not slow"],
+        # -n 0: run serially so -v lines keep the "path::test PASSED" shape parsed below.
+        [sys.executable, "-m", "pytest", "tests/", "-v", "--tb=short", "-m", "not slow", "-n", "0"],
         cwd=backend_dir,
         capture_output=True,
         text=True,
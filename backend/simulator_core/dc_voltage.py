@@ -20,10 +20,17 @@ def ocv_from_soc(soc: float) -> float:
     return Vmin + (Vmax - Vmin) * plateau
 
 
+# Cell OCV sampled every 0.1% SOC; get_pack_voltage_V interpolates between entries instead of calling exp per tick.
+_OCV_LUT_STEPS = 1000
+_OCV_LUT: tuple[float, ...] = tuple(ocv_from_soc(i / _OCV_LUT_STEPS) for i in range(_OCV_LUT_STEPS + 1))
+
+
 def get_pack_voltage_V(soc_pct: float, cells: int = DEFAULT_CELLS) -> float:
     """
     Compute DC pack voltage from SOC percentage.
 
+    Uses linear interpolation over the precomputed OCV table (error well below 1 mV per cell).
+
     Args:
         soc_pct: State of charge as a percentage [0, 100].
         cells: Number of cells in series (default 108).
@@ -31,5 +38,9 @@ def get_pack_voltage_V(soc_pct: float, cells: int = DEFAULT_CELLS) -> float:
     Returns:
         Pack voltage in volts.
     """
-    soc = max(0.0, min(100.0, soc_pct)) / 100.0
-    return ocv_from_soc(soc) * cells
+    x = max(0.0, min(100.0, soc_pct)) * (_OCV_LUT_STEPS / 100.0)
+    i = int(x)
+    if i >= _OCV_LUT_STEPS:
+        return _OCV_LUT[_OCV_LUT_STEPS] * cells
+    lo = _OCV_LUT[i]
+    return (lo + (x - i) * (_OCV_LUT[i + 1] - lo)) * cells
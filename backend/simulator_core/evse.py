@@ -66,6 +66,8 @@ class EVSE:
         "power_type",
         "tx_default_power_W",
         "tx_profile_valid_to",
+        "_v_cache_soc",
+        "_v_cache_V",
     )
 
     def __init__(
@@ -91,6 +93,8 @@ class EVSE:
         self.power_type = power_type  # "AC" or "DC", propagated from parent Charger
         self.tx_default_power_W = 7400.0  # Fallback power (W) when no SetChargingProfile received; propagated from Charger config
         self.tx_profile_valid_to: Optional[datetime] = None  # expiry of the active TxProfile; None = no expiry set
+        self._v_cache_soc = -1.0  # soc_pct the cached DC pack voltage was computed for
+        self._v_cache_V = 0.0
 
     def transition_to(self, new_state: EvseState) -> bool:
         """Validate and perform state transition. Returns True if applied."""
@@ -129,7 +133,13 @@ class EVSE:
         """Compute voltage: AC returns fixed 400V grid voltage, DC uses sigmoid OCV model."""
         if self.power_type == "AC":
             return AC_GRID_VOLTAGE_V
-        return get_pack_voltage_V(self.soc_pct, DEFAULT_CELLS)
+        soc_pct = self.soc_pct
+        if soc_pct != self._v_cache_soc:
+            # The metering tick computes this once per new SoC (power_to_current_A); snapshot/API reads
+            # between ticks, and ticks while suspended or full, reuse it.
+            self._v_cache_V = get_pack_voltage_V(soc_pct, DEFAULT_CELLS)
+            self._v_cache_soc = soc_pct
+        return self._v_cache_V
 
     def get_meter_snapshot(self) -> dict[str, float]:
         """Current meter values for MeterValues payload (FR-4)."""
@@ -148,6 +158,13 @@ class EVSE:
         """Convert power (W) to current (A) for 3-phase AC: I = P / (sqrt(3) * V)."""
         return power_W / (SQRT3 * AC_GRID_VOLTAGE_V) if power_W > 0 else 0.0
 
+    def power_to_current_A(self, power_W: float) -> float:
+        """Current (A) drawn at power_W: 3-phase AC formula, or DC power / pack voltage at the current SoC."""
+        if self.power_type == "AC":
+            return self.ac_power_to_current_A(power_W)
+        voltage = self.get_voltage_V()
+        return power_W / voltage if voltage else 0.0
+
     def start_transaction(
         self,
         transaction_id: int,
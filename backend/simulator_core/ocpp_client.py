@@ -1,12 +1,14 @@
 """Async OCPP 1.6 charge point client: Boot, Status, Authorize, Start/StopTransaction, MeterValues, SetChargingProfile, RemoteStartTransaction, RemoteStopTransaction."""
 import asyncio
 import base64
-import json
+import functools
 import logging
 import math
+import re
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Callable, Optional
 
+import orjson
 from ocpp.routing import on
 from ocpp.v16 import ChargePoint, call, call_result, datatypes
 from websockets.exceptions import ConnectionClosed
@@ -43,10 +45,42 @@ _CALL_RESULT = 3
 _CALL_ERROR = 4
 
 
-def _parse_ocpp_message_type(raw: str) -> str:
-    """Extract message type (action name or CallResult/CallError) from raw JSON message."""
+# Frame head of a well-formed Call/CallResult/CallError: [typeId, "uniqueId", "Action"|{...}|[...].
+# Group 1 is the type id; group 2 is the action (Call) or error code (CallError) when the third field is a string.
+# Only JSON whitespace is skipped (not \s, which also accepts Unicode spaces JSON rejects).
+_FRAME_HEAD = r'[ \t\r\n]*\[[ \t\r\n]*([234])[ \t\r\n]*,[ \t\r\n]*"[^"\\]*"[ \t\r\n]*,[ \t\r\n]*(?:"([^"\\]*)"|[{\[])'
+_FRAME_HEAD_STR = re.compile(_FRAME_HEAD)
+_FRAME_HEAD_BYTES = re.compile(_FRAME_HEAD.encode())
+_FRAME_TYPE_NAMES = {"3": "CallResult", "4": "CallError", b"3": "CallResult", b"4": "CallError"}
+
+
+def _parse_ocpp_message_type(raw: str | bytes) -> str:
+    """Extract message type (action name or CallResult/CallError) from raw JSON message.
+
+    Common frames are classified from their head with a regex; anything else (escaped strings,
+    odd shapes, invalid JSON) falls back to a full orjson parse.
+    """
+    if isinstance(raw, str):
+        m = _FRAME_HEAD_STR.match(raw)
+        closed = raw.endswith("]")
+    elif isinstance(raw, (bytes, bytearray)):
+        m = _FRAME_HEAD_BYTES.match(raw)
+        closed = raw.endswith(b"]")
+    else:
+        m = None
+    if m is not None and closed:
+        type_id, action = m.groups()
+        if type_id not in ("2", b"2"):
+            return _FRAME_TYPE_NAMES[type_id]
+        if isinstance(action, str):
+            return action
+        if action is not None:
+            try:
+                return action.decode()
+            except UnicodeDecodeError:
+                pass  # not valid UTF-8: let orjson reject the frame below
     try:
-        arr = json.loads(raw)
+        arr = orjson.loads(raw)
         if not isinstance(arr, list) or len(arr) < 3:
             return "Unknown"
         msg_type_id = arr[0]
@@ -57,7 +91,7 @@ def _parse_ocpp_message_type(raw: str) -> str:
         if msg_type_id == _CALL_ERROR:
             return "CallError"
         return "Unknown"
-    except (json.JSONDecodeError, TypeError):
+    except (orjson.JSONDecodeError, TypeError):
         return "Unknown"
 
 
@@ -148,18 +182,46 @@ _EVSE_STATE_TO_OCPP: dict[EvseState, ChargePointStatus] = {
 }
 
 
+# Wire strings (e.g. "Energy.Active.Import.Register", "Wh") -> enum; the hit path for every sampled value.
+_MEASURAND_MAP: dict[str, Measurand] = {m.value: m for m in Measurand}
+_UNIT_MAP: dict[str, UnitOfMeasure] = {u.value: u for u in UnitOfMeasure}
+
+
 def _measurand_from_str(s: str) -> Measurand:
     """Map measurand string to enum (e.g. 'Energy.Active.Import.Register')."""
-    m = getattr(Measurand, s.replace(".", "_").lower(), None)
+    m = _MEASURAND_MAP.get(s)
+    if m is None:
+        # Other spellings (e.g. member names): normalize and look up by attribute.
+        m = getattr(Measurand, s.replace(".", "_").lower(), None)
     return m if m is not None else Measurand.energy_active_import_register
 
 
 def _unit_from_str(s: str) -> UnitOfMeasure:
     """Map unit string to enum (e.g. 'Wh' -> wh)."""
-    u = getattr(UnitOfMeasure, s.lower().replace(" ", "_"), None)
+    u = _UNIT_MAP.get(s)
+    if u is None:
+        u = getattr(UnitOfMeasure, s.lower().replace(" ", "_"), None)
     return u if u is not None else UnitOfMeasure.wh
 
 
+@functools.lru_cache(maxsize=64)
+def _sampled_kwargs(measurand: Any, unit: Any, location: Optional[str], phase: Optional[str]) -> dict[str, Any]:
+    """SampledValue keyword arguments for every field but value, resolved once per (measurand, unit, location, phase).
+
+    The returned dict is shared between calls; callers only unpack it.
+    """
+    kw: dict[str, Any] = {
+        "measurand": _measurand_from_str(measurand) if isinstance(measurand, str) else measurand,
+        "unit": _unit_from_str(unit) if isinstance(unit, str) else unit,
+    }
+    if location is not None:
+        kw["location"] = location
+    if phase is not None:
+        phase_key = phase.lower().replace("-", "_")
+        kw["phase"] = getattr(Phase, phase_key, phase)
+    return kw
+
+
 def _dict_to_meter_values_payload(d: DictMeterPayload) -> call.MeterValuesPayload:
     """Convert our meter payload dict to ocpp.v16 call.MeterValuesPayload."""
     connector_id = d["connectorId"]
@@ -167,20 +229,13 @@ def _dict_to_meter_values_payload(d: DictMeterPayload) -> call.MeterValuesPayloa
     meter_value_list = []
     for mv in d["meterValue"]:
         ts = mv["timestamp"]
-        sampled = []
-        for sv in mv["sampledValue"]:
-            kw: dict[str, Any] = {
-                "value": sv["value"],
-                "measurand": _measurand_from_str(sv["measurand"]) if isinstance(sv["measurand"], str) else sv["measurand"],
-                "unit": _unit_from_str(sv["unit"]) if isinstance(sv["unit"], str) else sv["unit"],
-            }
-            if "location" in sv and sv["location"] is not None:
-                kw["location"] = sv["location"]
-            if "phase" in sv and sv["phase"] is not None:
-                phase_str = sv["phase"]
-                phase_key = phase_str.lower().replace("-", "_")
-                kw["phase"] = getattr(Phase, phase_key, phase_str)
-            sampled.append(datatypes.SampledValue(**kw))
+        sampled = [
+            datatypes.SampledValue(
+                value=sv["value"],
+                **_sampled_kwargs(sv["measurand"], sv["unit"], sv.get("location"), sv.get("phase")),
+            )
+            for sv in mv["sampledValue"]
+        ]
         meter_value_list.append(datatypes.MeterValue(timestamp=ts, sampled_value=sampled))
     return call.MeterValuesPayload(
         connector_id=connector_id,
@@ -0,0 +1,57 @@
+"""Fixtures shared by the API tests."""
+import httpx
+import orjson
+import pytest
+
+from repositories.charger_repository import create_charger
+from simulator_core import store
+
+
+_httpx_response_json = httpx.Response.json
+
+
+def _orjson_response_json(self, **kwargs):
+    """Decode response bodies with orjson; keyword arguments fall back to httpx's stdlib decoder."""
+    if kwargs:
+        return _httpx_response_json(self, **kwargs)
+    return orjson.loads(self.content)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _orjson_responses():
+    """Route every ``r.json()`` in an API test module through orjson; httpx's own method is restored after the module.
+
+    Module scope rather than session: tests/api is not a package, so only module teardown keeps the patch
+    from leaking into later non-API tests on the same worker.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(httpx.Response, "json", _orjson_response_json)
+        yield
+
+
+def _stop_background_tasks(sim) -> None:
+    """Stop a charger's connect loop and cancel its meter tasks (they outlive the test on the shared TestClient loop)."""
+    sim.set_stop_connect(True)
+    for task, _stop_event in sim._meter_tasks.values():
+        loop = task.get_loop()
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(task.cancel)
+
+
+@pytest.fixture(autouse=True)
+def _reset_store():
+    """Clear the in-memory simulator store after each test so no charger state leaks between tests."""
+    yield
+    for sim in store.get_all():
+        _stop_background_tasks(sim)
+    store.clear()
+
+
+@pytest.fixture
+def db_charger(db_session):
+    """Factory that inserts a charger row directly via the repository (DB only, not in the simulator store)."""
+    def _make(**kwargs):
+        kwargs.setdefault("connection_url", "ws://x/ocpp")
+        return create_charger(db_session, **kwargs)
+
+    return _make
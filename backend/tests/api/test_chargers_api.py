@@ -1,26 +1,18 @@
 """API tests: chargers endpoints."""
-import uuid
 
 import pytest
 
-from repositories.location_repository import create_location
+from repositories.charger_repository import update_charger as repo_update_charger
 
-pytestmark = pytest.mark.api
+# Tests share charge_point_id CP-001; keep them on one xdist worker.
+pytestmark = [pytest.mark.api, pytest.mark.xdist_group("cp001")]
 
 CP_ID = "CP-001"
 
 
-@pytest.fixture
-def location(db_session):
-    """Create a location for charger tests (unique id per test)."""
-    loc_id = f"loc-charger-{uuid.uuid4().hex[:8]}"
-    return create_location(db_session, "Charger Test Location", "1 Test St", loc_id)
-
-
-@pytest.fixture
-def loc_id(location):
-    """Location id from location fixture."""
-    return location.id
+async def _noop_connect_charge_point(*args, **kwargs) -> None:
+    """Stand-in for connect_charge_point; the connect tests only check the HTTP response, so no task outlives the test loop."""
+    return None
 
 
 def test_list_chargers_unknown_location_404(client):
@@ -29,24 +21,17 @@ def test_list_chargers_unknown_location_404(client):
     assert r.status_code == 404
 
 
-def test_list_chargers_empty(client, location, loc_id):
+def test_list_chargers_empty(client, module_location):
     """GET /api/locations/{id}/chargers returns 200 and empty list when no chargers."""
-    r = client.get(f"/api/locations/{loc_id}/chargers")
+    r = client.get(f"/api/locations/{module_location.id}/chargers")
     assert r.status_code == 200
     assert r.json() == []
 
 
-def test_list_chargers_includes_db_only_charger(client, location, loc_id, db_session):
+def test_list_chargers_includes_db_only_charger(client, module_location, db_charger):
     """GET /api/locations/{id}/chargers returns charger from DB even when not in store (evse_count=0, connected=False)."""
-    from repositories.charger_repository import create_charger as repo_create_charger
-    repo_create_charger(
-        db_session,
-        location_id=loc_id,
-        charge_point_id="CP-DB-ONLY",
-        connection_url="ws://x/ocpp",
-        charger_name="DB Only",
-    )
-    r = client.get(f"/api/locations/{loc_id}/chargers")
+    db_charger(location_id=module_location.id, charge_point_id="CP-DB-ONLY", charger_name="DB Only")
+    r = client.get(f"/api/locations/{module_location.id}/chargers")
     assert r.status_code == 200
     data = r.json()
     cp = next((c for c in data if c["charge_point_id"] == "CP-DB-ONLY"), None)
@@ -55,8 +40,8 @@ def test_list_chargers_includes_db_only_charger(client, location, loc_id, db_ses
     assert cp["connected"] is False
 
 
-def test_create_charger_success(client, location, loc_id):
-    """POST /api/locations/{id}/chargers returns 201 and charger summary."""
+def test_charger_crud_flow(client, module_location):
+    """POST creates (201), GET returns detail, PATCH updates metadata, DELETE removes (204) and GET then 404s."""
     body = {
         "connection_url": "ws://example.com/ocpp",
         "charge_point_id": CP_ID,
@@ -64,13 +49,31 @@ def test_create_charger_success(client, location, loc_id):
         "ocpp_version": "1.6",
         "evse_count": 2,
     }
-    r = client.post(f"/api/locations/{loc_id}/chargers", json=body)
+    r = client.post(f"/api/locations/{module_location.id}/chargers", json=body)
     assert r.status_code == 201
     data = r.json()
     assert data["charge_point_id"] == CP_ID
     assert data["charger_name"] == "Test Charger"
     assert data["evse_count"] == 2
-    assert data["location_id"] == loc_id
+    assert data["location_id"] == module_location.id
+
+    r = client.get(f"/api/chargers/{CP_ID}")
+    assert r.status_code == 200
+    data = r.json()
+    assert data["charge_point_id"] == CP_ID
+    assert "evses" in data
+    assert "config" in data
+
+    r = client.patch(
+        f"/api/chargers/{CP_ID}",
+        json={"charger_name": "Updated Name", "connection_url": "ws://other/ocpp"},
+    )
+    assert r.status_code == 200
+    assert r.json()["charger_name"] == "Updated Name"
+
+    r = client.delete(f"/api/chargers/{CP_ID}")
+    assert r.status_code == 204
+    assert client.get(f"/api/chargers/{CP_ID}").status_code == 404
 
 
 def test_create_charger_unknown_location_404(client):
@@ -85,7 +88,7 @@ def test_create_charger_unknown_location_404(client):
     assert r.status_code == 404
 
 
-def test_create_charger_duplicate_409(client, location, loc_id):
+def test_create_charger_duplicate_409(client, module_location):
     """POST /api/locations/{id}/chargers returns 409 when charge_point_id already exists."""
     body = {
         "connection_url": "ws://a/ocpp",
@@ -93,9 +96,9 @@ def test_create_charger_duplicate_409(client, location, loc_id):
         "charger_name": "First",
         "ocpp_version": "1.6",
     }
-    r1 = client.post(f"/api/locations/{loc_id}/chargers", json=body)
+    r1 = client.post(f"/api/locations/{module_location.id}/chargers", json=body)
     assert r1.status_code == 201
-    r2 = client.post(f"/api/locations/{loc_id}/chargers", json=body)
+    r2 = client.post(f"/api/locations/{module_location.id}/chargers", json=body)
     assert r2.status_code == 409
 
 
@@ -105,34 +108,9 @@ def test_get_charger_404(client):
     assert r.status_code == 404
 
 
-def test_get_charger_success(client, location, loc_id):
-    """GET /api/chargers/{id} returns 200 and charger detail after create."""
-    body = {
-        "connection_url": "ws://example.com/ocpp",
-        "charge_point_id": CP_ID,
-        "charger_name": "Detail Charger",
-        "ocpp_version": "1.6",
-    }
-    client.post(f"/api/locations/{loc_id}/chargers", json=body)
-    r = client.get(f"/api/chargers/{CP_ID}")
-    assert r.status_code == 200
-    data = r.json()
-    assert data["charge_point_id"] == CP_ID
-    assert "evses" in data
-    assert "config" in data
-
-
-def test_get_charger_hydrates_from_db_when_not_in_store(client, location, loc_id, db_session):
+def test_get_charger_hydrates_from_db_when_not_in_store(client, module_location, db_charger):
     """GET /api/chargers/{id} hydrates charger from DB when not in store (evse_count from DB)."""
-    from repositories.charger_repository import create_charger as repo_create_charger
-    repo_create_charger(
-        db_session,
-        location_id=loc_id,
-        charge_point_id="CP-HYDRATE",
-        connection_url="ws://x/ocpp",
-        charger_name="Hydrate Me",
-        evse_count=2,
-    )
+    db_charger(location_id=module_location.id, charge_point_id="CP-HYDRATE", charger_name="Hydrate Me", evse_count=2)
     r = client.get("/api/chargers/CP-HYDRATE")
     assert r.status_code == 200
     data = r.json()
@@ -140,7 +118,7 @@ def test_get_charger_hydrates_from_db_when_not_in_store(client, location, loc_id
     assert len(data["evses"]) == 2
 
 
-def test_update_charger_config_success(client, location, loc_id):
+def test_update_charger_config_success(client, module_location):
     """PATCH /api/chargers/{id}/config returns 200 and updated config."""
     body = {
         "connection_url": "ws://example.com/ocpp",
@@ -148,7 +126,7 @@ def test_update_charger_config_success(client, location, loc_id):
         "charger_name": "Config Charger",
         "ocpp_version": "1.6",
     }
-    client.post(f"/api/locations/{loc_id}/chargers", json=body)
+    client.post(f"/api/locations/{module_location.id}/chargers", json=body)
     r = client.patch(f"/api/chargers/{CP_ID}/config", json={"HeartbeatInterval": 60})
     assert r.status_code == 200
     assert r.json()["config"].get("HeartbeatInterval") == 60
@@ -160,7 +138,7 @@ def test_update_charger_config_404(client):
     assert r.status_code == 404
 
 
-def test_update_charger_config_empty_body_returns_current(client, location, loc_id):
+def test_update_charger_config_empty_body_returns_current(client, module_location):
     """PATCH /api/chargers/{id}/config with empty body returns 200 and current detail (no changes)."""
     body = {
         "connection_url": "ws://example.com/ocpp",
@@ -168,45 +146,21 @@ def test_update_charger_config_empty_body_returns_current(client, location, loc_
         "charger_name": "Config Charger",
         "ocpp_version": "1.6",
     }
-    client.post(f"/api/locations/{loc_id}/chargers", json=body)
+    client.post(f"/api/locations/{module_location.id}/chargers", json=body)
     r = client.patch(f"/api/chargers/{CP_ID}/config", json={})
     assert r.status_code == 200
     assert r.json()["charge_point_id"] == CP_ID
 
 
-def test_update_charger_success(client, location, loc_id):
-    """PATCH /api/chargers/{id} returns 200 and updated metadata."""
-    body = {
-        "connection_url": "ws://example.com/ocpp",
-        "charge_point_id": CP_ID,
-        "charger_name": "Original",
-        "ocpp_version": "1.6",
-    }
-    client.post(f"/api/locations/{loc_id}/chargers", json=body)
-    r = client.patch(
-        f"/api/chargers/{CP_ID}",
-        json={"charger_name": "Updated Name", "connection_url": "ws://other/ocpp"},
-    )
-    assert r.status_code == 200
-    assert r.json()["charger_name"] == "Updated Name"
-
-
 def test_update_charger_404(client):
     """PATCH /api/chargers/{id} returns 404 for unknown charger."""
     r = client.patch("/api/chargers/CP-NONE", json={"charger_name": "X"})
     assert r.status_code == 404
 
 
-def test_update_charger_when_not_in_store(client, location, loc_id, db_session):
+def test_update_charger_when_not_in_store(client, module_location, db_charger):
     """PATCH /api/chargers/{id} when charger is in DB but not in store returns 200 (builds detail from row)."""
-    from repositories.charger_repository import create_charger as repo_create_charger
-    repo_create_charger(
-        db_session,
-        location_id=loc_id,
-        charge_point_id="CP-NOT-IN-STORE",
-        connection_url="ws://x/ocpp",
-        charger_name="Original",
-    )
+    db_charger(location_id=module_location.id, charge_point_id="CP-NOT-IN-STORE", charger_name="Original")
     r = client.patch(
         "/api/chargers/CP-NOT-IN-STORE",
         json={"charger_name": "Updated From Row"},
@@ -215,7 +169,7 @@ def test_update_charger_when_not_in_store(client, location, loc_id, db_session):
     assert r.json()["charger_name"] == "Updated From Row"
 
 
-def test_get_charger_logs_success(client, location, loc_id):
+def test_get_charger_logs_success(client, module_location):
     """GET /api/chargers/{id}/logs returns 200 and list (possibly empty)."""
     body = {
         "connection_url": "ws://example.com/ocpp",
@@ -223,7 +177,7 @@ def test_get_charger_logs_success(client, location, loc_id):
         "charger_name": "Log Charger",
         "ocpp_version": "1.6",
     }
-    client.post(f"/api/locations/{loc_id}/chargers", json=body)
+    client.post(f"/api/locations/{module_location.id}/chargers", json=body)
     r = client.get(f"/api/chargers/{CP_ID}/logs")
     assert r.status_code == 200
     assert isinstance(r.json(), list)
@@ -235,7 +189,7 @@ def test_get_charger_logs_404(client):
     assert r.status_code == 404
 
 
-def test_clear_charger_logs_success(client, location, loc_id):
+def test_clear_charger_logs_success(client, module_location):
     """DELETE /api/chargers/{id}/logs returns 204."""
     body = {
         "connection_url": "ws://example.com/ocpp",
@@ -243,7 +197,7 @@ def test_clear_charger_logs_success(client, location, loc_id):
         "charger_name": "Log Charger",
         "ocpp_version": "1.6",
     }
-    client.post(f"/api/locations/{loc_id}/chargers", json=body)
+    client.post(f"/api/locations/{module_location.id}/chargers", json=body)
     r = client.delete(f"/api/chargers/{CP_ID}/logs")
     assert r.status_code == 204
 
@@ -254,64 +208,42 @@ def test_clear_charger_logs_404(client):
     assert r.status_code == 404
 
 
-def test_delete_charger_success(client, location, loc_id):
-    """DELETE /api/chargers/{id} returns 204 and charger is gone."""
-    body = {
-        "connection_url": "ws://example.com/ocpp",
-        "charge_point_id": CP_ID,
-        "charger_name": "To Delete",
-        "ocpp_version": "1.6",
-    }
-    client.post(f"/api/locations/{loc_id}/chargers", json=body)
-    r = client.delete(f"/api/chargers/{CP_ID}")
-    assert r.status_code == 204
-    r2 = client.get(f"/api/chargers/{CP_ID}")
-    assert r2.status_code == 404
-
-
 def test_delete_charger_404(client):
     """DELETE /api/chargers/{id} returns 404 for unknown charger."""
     r = client.delete("/api/chargers/CP-NONE")
     assert r.status_code == 404
 
 
-def test_connect_charger_202(client, location, loc_id):
+async def test_connect_charger_202(async_client, module_location, monkeypatch):
     """POST /api/chargers/{id}/connect returns 202 (async connect)."""
+    monkeypatch.setattr("api.chargers.connect_charge_point", _noop_connect_charge_point)
     body = {
         "connection_url": "ws://example.com/ocpp",
         "charge_point_id": CP_ID,
         "charger_name": "Connect Charger",
         "ocpp_version": "1.6",
     }
-    client.post(f"/api/locations/{loc_id}/chargers", json=body)
-    r = client.post(f"/api/chargers/{CP_ID}/connect")
+    await async_client.post(f"/api/locations/{module_location.id}/chargers", json=body)
+    r = await async_client.post(f"/api/chargers/{CP_ID}/connect")
     assert r.status_code == 202
 
 
-def test_connect_charger_404(client):
+async def test_connect_charger_404(async_client):
     """POST /api/chargers/{id}/connect returns 404 for unknown charger."""
-    r = client.post("/api/chargers/CP-NONE/connect")
+    r = await async_client.post("/api/chargers/CP-NONE/connect")
     assert r.status_code == 404
 
 
-def test_connect_charger_basic_auth_no_password_400(client, location, loc_id, db_session):
+async def test_connect_charger_basic_auth_no_password_400(async_client, module_location, db_session, db_charger):
     """POST /api/chargers/{id}/connect returns 400 when security_profile is basic but no password set."""
-    from repositories.charger_repository import create_charger as repo_create_charger
-    from repositories.charger_repository import update_charger as repo_update_charger
-    repo_create_charger(
-        db_session,
-        location_id=loc_id,
-        charge_point_id="CP-BASIC-NO-PWD",
-        connection_url="ws://x/ocpp",
-        charger_name="Basic",
-    )
+    db_charger(location_id=module_location.id, charge_point_id="CP-BASIC-NO-PWD", charger_name="Basic")
     repo_update_charger(db_session, "CP-BASIC-NO-PWD", security_profile="basic")
-    r = client.post("/api/chargers/CP-BASIC-NO-PWD/connect")
+    r = await async_client.post("/api/chargers/CP-BASIC-NO-PWD/connect")
     assert r.status_code == 400
     assert "password" in r.json().get("detail", "").lower()
 
 
-def test_disconnect_charger_204(client, location, loc_id):
+async def test_disconnect_charger_204(async_client, module_location):
     """POST /api/chargers/{id}/disconnect returns 204."""
     body = {
         "connection_url": "ws://example.com/ocpp",
@@ -319,27 +251,27 @@ def test_disconnect_charger_204(client, location, loc_id):
         "charger_name": "Disconnect Charger",
         "ocpp_version": "1.6",
     }
-    client.post(f"/api/locations/{loc_id}/chargers", json=body)
-    r = client.post(f"/api/chargers/{CP_ID}/disconnect")
+    await async_client.post(f"/api/locations/{module_location.id}/chargers", json=body)
+    r = await async_client.post(f"/api/chargers/{CP_ID}/disconnect")
     assert r.status_code == 204
 
 
-def test_disconnect_charger_404(client):
+async def test_disconnect_charger_404(async_client):
     """POST /api/chargers/{id}/disconnect returns 404 for unknown charger."""
-    r = client.post("/api/chargers/CP-NONE/disconnect")
+    r = await async_client.post("/api/chargers/CP-NONE/disconnect")
     assert r.status_code == 404
 
 
-def test_start_transaction_404(client):
+async def test_start_transaction_404(async_client):
     """POST .../transactions/start returns 404 for unknown charger."""
-    r = client.post(
+    r = await async_client.post(
         "/api/chargers/CP-NONE/transactions/start",
         json={"connector_id": 1, "id_tag": "TAG1"},
     )
     assert r.status_code == 404
 
 
-def test_start_transaction_not_connected_400(client, location, loc_id):
+async def test_start_transaction_not_connected_400(async_client, module_location):
     """POST .../transactions/start returns 400 when charger not connected to CSMS."""
     body = {
         "connection_url": "ws://example.com/ocpp",
@@ -347,8 +279,8 @@ def test_start_transaction_not_connected_400(client, location, loc_id):
         "charger_name": "Tx Charger",
         "ocpp_version": "1.6",
     }
-    client.post(f"/api/locations/{loc_id}/chargers", json=body)
-    r = client.post(
+    await async_client.post(f"/api/locations/{module_location.id}/chargers", json=body)
+    r = await async_client.post(
         f"/api/chargers/{CP_ID}/transactions/start",
         json={"connector_id": 1, "id_tag": "TAG1"},
     )
@@ -356,16 +288,16 @@ def test_start_transaction_not_connected_400(client, location, loc_id):
     assert "not connected" in r.json().get("detail", "").lower()
 
 
-def test_stop_transaction_404(client):
+async def test_stop_transaction_404(async_client):
     """POST .../transactions/stop returns 404 for unknown charger."""
-    r = client.post(
+    r = await async_client.post(
         "/api/chargers/CP-NONE/transactions/stop",
         json={"connector_id": 1},
     )
     assert r.status_code == 404
 
 
-def test_stop_transaction_not_connected_400(client, location, loc_id):
+async def test_stop_transaction_not_connected_400(async_client, module_location):
     """POST .../transactions/stop returns 400 when charger not connected."""
     body = {
         "connection_url": "ws://example.com/ocpp",
@@ -373,8 +305,8 @@ def test_stop_transaction_not_connected_400(client, location, loc_id):
         "charger_name": "Tx Charger",
         "ocpp_version": "1.6",
     }
-    client.post(f"/api/locations/{loc_id}/chargers", json=body)
-    r = client.post(
+    await async_client.post(f"/api/locations/{module_location.id}/chargers", json=body)
+    r = await async_client.post(
         f"/api/chargers/{CP_ID}/transactions/stop",
         json={"connector_id": 1},
     )
@@ -1,27 +1,12 @@
 """API tests: import endpoints (CSV/JSON upload and templates)."""
 import io
-import uuid
 
 import pytest
 
-from repositories.location_repository import create_location
 
 pytestmark = pytest.mark.api
 
 
-@pytest.fixture
-def location(db_session):
-    """Create a location for import tests (unique id per test)."""
-    loc_id = f"loc-import-{uuid.uuid4().hex[:8]}"
-    return create_location(db_session, "Import Test Location", "3 Test St", loc_id)
-
-
-@pytest.fixture
-def loc_id(location):
-    """Location id from location fixture."""
-    return location.id
-
-
 def test_import_chargers_unknown_location_404(client):
     """POST /api/locations/{id}/import/chargers returns 404 for unknown location."""
     data = {"file": ("chargers.csv", io.BytesIO(b"connection_url,charger_name,charge_point_id\nws://x/o,A01,CP-A01"), "text/csv")}
@@ -29,11 +14,11 @@ def test_import_chargers_unknown_location_404(client):
     assert r.status_code == 404
 
 
-def test_import_chargers_csv_success(client, location, loc_id):
+def test_import_chargers_csv_success(client, module_location):
     """POST /api/locations/{id}/import/chargers with valid CSV returns 200 and success list."""
     csv = b"connection_url,charger_name,charge_point_id,charge_point_vendor,charge_point_model,firmware_version,number_of_evses,ocpp_version\nws://example.com/ocpp,Imported Charger,CP-IMP,FastCharge,Pro 150,1.0,1,1.6\n"
     data = {"file": ("chargers.csv", io.BytesIO(csv), "text/csv")}
-    r = client.post(f"/api/locations/{loc_id}/import/chargers", files=data)
+    r = client.post(f"/api/locations/{module_location.id}/import/chargers", files=data)
     assert r.status_code == 200
     body = r.json()
     assert "success" in body and "failed" in body
@@ -41,10 +26,21 @@ def test_import_chargers_csv_success(client, location, loc_id):
     assert body["success"][0]["charge_point_id"] == "CP-IMP"
 
 
-def test_import_chargers_empty_file_400(client, location, loc_id):
+def test_import_chargers_duplicate_within_file(client, module_location):
+    """A charge_point_id repeated later in the same upload fails that row (existing ids are prefetched once)."""
+    csv = b"connection_url,charger_name,charge_point_id\nws://x/o,First,CP-DUP-IMP\nws://x/o,Second,CP-DUP-IMP\n"
+    data = {"file": ("chargers.csv", io.BytesIO(csv), "text/csv")}
+    r = client.post(f"/api/locations/{module_location.id}/import/chargers", files=data)
+    assert r.status_code == 200
+    body = r.json()
+    assert [c["charger_name"] for c in body["success"]] == ["First"]
+    assert [f["error"] for f in body["failed"]] == ["charger already exists with charge_point_id 'CP-DUP-IMP'"]
+
+
+def test_import_chargers_empty_file_400(client, module_location):
     """POST /api/locations/{id}/import/chargers with empty file returns 400."""
     data = {"file": ("empty.csv", io.BytesIO(b""), "text/csv")}
-    r = client.post(f"/api/locations/{loc_id}/import/chargers", files=data)
+    r = client.post(f"/api/locations/{module_location.id}/import/chargers", files=data)
     assert r.status_code == 400
 
 
@@ -56,11 +52,11 @@ def test_import_vehicles_unknown_location_404(client):
     assert r.status_code == 404
 
 
-def test_import_vehicles_csv_success(client, location, loc_id):
+def test_import_vehicles_csv_success(client, module_location):
     """POST /api/locations/{id}/import/vehicles with valid CSV returns 200 and success list."""
     csv = b"name,idTag,battery_capacity_kWh\nImported Vehicle,IMP-TAG,80\n"
     data = {"file": ("vehicles.csv", io.BytesIO(csv), "text/csv")}
-    r = client.post(f"/api/locations/{loc_id}/import/vehicles", files=data)
+    r = client.post(f"/api/locations/{module_location.id}/import/vehicles", files=data)
     assert r.status_code == 200
     body = r.json()
     assert "success" in body and "failed" in body
@@ -68,10 +64,24 @@ def test_import_vehicles_csv_success(client, location, loc_id):
     assert body["success"][0]["name"] == "Imported Vehicle"
 
 
-def test_import_vehicles_empty_file_400(client, location, loc_id):
+def test_import_vehicles_duplicate_within_file(client, module_location):
+    """A name or idTag repeated later in the same upload fails that row (existing keys are prefetched once)."""
+    csv = b"name,idTag,battery_capacity_kWh\nDup V,DUP-1,80\nDup V,DUP-2,80\nOther V,DUP-1,80\n"
+    data = {"file": ("vehicles.csv", io.BytesIO(csv), "text/csv")}
+    r = client.post(f"/api/locations/{module_location.id}/import/vehicles", files=data)
+    assert r.status_code == 200
+    body = r.json()
+    assert [v["name"] for v in body["success"]] == ["Dup V"]
+    assert [f["error"] for f in body["failed"]] == [
+        "vehicle with name 'Dup V' already exists",
+        "vehicle with idTag 'DUP-1' already exists",
+    ]
+
+
+def test_import_vehicles_empty_file_400(client, module_location):
     """POST /api/locations/{id}/import/vehicles with empty file returns 400."""
     data = {"file": ("empty.csv", io.BytesIO(b""), "text/csv")}
-    r = client.post(f"/api/locations/{loc_id}/import/vehicles", files=data)
+    r = client.post(f"/api/locations/{module_location.id}/import/vehicles", files=data)
     assert r.status_code == 400
 
 
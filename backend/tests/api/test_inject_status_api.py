@@ -3,9 +3,16 @@ import uuid
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
-from repositories.location_repository import create_location
+from sqlalchemy.orm import Session
 
-pytestmark = pytest.mark.api
+from api.chargers import _hydrate_charger
+from repositories.charger_repository import create_charger, delete_charger
+from repositories.location_repository import create_location, delete_location
+from simulator_core.evse import EvseState
+from simulator_core.store import get_by_id as store_get
+
+# All tests share CP-INJECT-TEST and its module-scoped rows; keep them on one xdist worker.
+pytestmark = [pytest.mark.api, pytest.mark.xdist_group("inject")]
 
 CP_ID = "CP-INJECT-TEST"
 
@@ -15,35 +22,43 @@ CP_ID = "CP-INJECT-TEST"
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def location(db_session):
-    loc_id = f"loc-inject-{uuid.uuid4().hex[:8]}"
-    return create_location(db_session, "Inject Test Location", "1 Test St", loc_id)
+@pytest.fixture(scope="module")
+def _inject_charger_row(connection):
+    """Insert the location and charger once per module into the outer transaction, outside the per-test savepoints."""
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        loc = create_location(session, "Inject Test Location", "1 Test St", f"loc-inject-{uuid.uuid4().hex[:8]}")
+        create_charger(
+            session,
+            location_id=loc.id,
+            charge_point_id=CP_ID,
+            connection_url="ws://example.com/ocpp",
+            charger_name="Inject Charger",
+            evse_count=2,
+        )
+        yield
+        delete_charger(session, CP_ID)
+        delete_location(session, loc.id)
+    finally:
+        session.close()
 
 
 @pytest.fixture
-def loc_id(location):
-    return location.id
+def charger_in_store(_inject_charger_row, db_session):
+    """Hydrate the shared charger row into the simulator store (the store is reset after each test)."""
+    return _hydrate_charger(db_session, CP_ID)
 
 
 @pytest.fixture
-def charger_in_store(client, location, loc_id):
-    """Create charger via API so it lands in the simulator store."""
-    body = {
-        "connection_url": "ws://example.com/ocpp",
-        "charge_point_id": CP_ID,
-        "charger_name": "Inject Charger",
-        "ocpp_version": "1.6",
-        "evse_count": 2,
-    }
-    r = client.post(f"/api/locations/{loc_id}/chargers", json=body)
-    assert r.status_code == 201
-    return r.json()
+def preparing_evse(charger_in_store):
+    """EVSE 1 moved to Preparing, from which Faulted is a valid transition."""
+    evse = charger_in_store.get_evse(1)
+    evse.state = EvseState.Preparing
+    return evse
 
 
 def _attach_mock_client(cp_id: str) -> MagicMock:
     """Attach a mock OCPP client so sim.is_connected returns True."""
-    from simulator_core.store import get_by_id as store_get
     sim = store_get(cp_id)
     assert sim is not None, f"Charger {cp_id} not in store"
     mock_conn = MagicMock()
@@ -60,18 +75,18 @@ def _attach_mock_client(cp_id: str) -> MagicMock:
 # ---------------------------------------------------------------------------
 
 
-def test_inject_status_unknown_charger_404(client):
+async def test_inject_status_unknown_charger_404(async_client):
     """Unknown charge_point_id → 404."""
-    r = client.post(
+    r = await async_client.post(
         "/api/chargers/CP-DOES-NOT-EXIST/inject_status",
         json={"connector_id": 1, "status": "Available"},
     )
     assert r.status_code == 404
 
 
-def test_inject_status_not_connected_400(client, charger_in_store):
+async def test_inject_status_not_connected_400(async_client, charger_in_store):
     """Charger exists but has no OCPP client attached → 400 not connected."""
-    r = client.post(
+    r = await async_client.post(
         f"/api/chargers/{CP_ID}/inject_status",
         json={"connector_id": 1, "status": "Unavailable"},
     )
@@ -79,10 +94,10 @@ def test_inject_status_not_connected_400(client, charger_in_store):
     assert "not connected" in r.json()["detail"].lower()
 
 
-def test_inject_status_connector_not_found_400(client, charger_in_store):
+async def test_inject_status_connector_not_found_400(async_client, charger_in_store):
     """connector_id that doesn't exist on the charger → 400."""
     _attach_mock_client(CP_ID)
-    r = client.post(
+    r = await async_client.post(
         f"/api/chargers/{CP_ID}/inject_status",
         json={"connector_id": 99, "status": "Available"},
     )
@@ -90,10 +105,10 @@ def test_inject_status_connector_not_found_400(client, charger_in_store):
     assert "evse" in r.json()["detail"].lower()
 
 
-def test_inject_status_invalid_transition_400(client, charger_in_store):
+async def test_inject_status_invalid_transition_400(async_client, charger_in_store):
     """Available → Charging is not a valid OCPP 1.6 transition → 400."""
     _attach_mock_client(CP_ID)
-    r = client.post(
+    r = await async_client.post(
         f"/api/chargers/{CP_ID}/inject_status",
         json={"connector_id": 1, "status": "Charging"},
     )
@@ -101,15 +116,11 @@ def test_inject_status_invalid_transition_400(client, charger_in_store):
     assert "transition" in r.json()["detail"].lower()
 
 
-def test_inject_status_faulted_missing_error_code_400(client, charger_in_store):
+async def test_inject_status_faulted_missing_error_code_400(async_client, preparing_evse):
     """Faulted status without error_code field → 400."""
     _attach_mock_client(CP_ID)
-    # Preparing → Faulted is a valid transition
-    from simulator_core.store import get_by_id as store_get
-    from simulator_core.evse import EvseState
-    store_get(CP_ID).get_evse(1).state = EvseState.Preparing
 
-    r = client.post(
+    r = await async_client.post(
         f"/api/chargers/{CP_ID}/inject_status",
         json={"connector_id": 1, "status": "Faulted"},
     )
@@ -117,14 +128,11 @@ def test_inject_status_faulted_missing_error_code_400(client, charger_in_store):
     assert "error_code" in r.json()["detail"].lower()
 
 
-def test_inject_status_faulted_no_error_value_400(client, charger_in_store):
+async def test_inject_status_faulted_no_error_value_400(async_client, preparing_evse):
     """Faulted status with error_code='NoError' → 400 (NoError not allowed with Faulted)."""
     _attach_mock_client(CP_ID)
-    from simulator_core.store import get_by_id as store_get
-    from simulator_core.evse import EvseState
-    store_get(CP_ID).get_evse(1).state = EvseState.Preparing
 
-    r = client.post(
+    r = await async_client.post(
         f"/api/chargers/{CP_ID}/inject_status",
         json={"connector_id": 1, "status": "Faulted", "error_code": "NoError"},
     )
@@ -137,11 +145,11 @@ def test_inject_status_faulted_no_error_value_400(client, charger_in_store):
 # ---------------------------------------------------------------------------
 
 
-def test_inject_status_success_204(client, charger_in_store):
+async def test_inject_status_success_204(async_client, charger_in_store):
     """Valid non-Faulted transition → 204, OCPP client called once."""
     mock_client = _attach_mock_client(CP_ID)
 
-    r = client.post(
+    r = await async_client.post(
         f"/api/chargers/{CP_ID}/inject_status",
         json={"connector_id": 1, "status": "Unavailable"},
     )
@@ -149,14 +157,11 @@ def test_inject_status_success_204(client, charger_in_store):
     mock_client.send_status_notification.assert_awaited_once()
 
 
-def test_inject_status_faulted_success_204(client, charger_in_store):
+async def test_inject_status_faulted_success_204(async_client, preparing_evse):
     """Faulted + valid error_code → 204; optional info and vendor_error_code accepted."""
     mock_client = _attach_mock_client(CP_ID)
-    from simulator_core.store import get_by_id as store_get
-    from simulator_core.evse import EvseState
-    store_get(CP_ID).get_evse(1).state = EvseState.Preparing
 
-    r = client.post(
+    r = await async_client.post(
         f"/api/chargers/{CP_ID}/inject_status",
         json={
             "connector_id": 1,
@@ -170,15 +175,14 @@ def test_inject_status_faulted_success_204(client, charger_in_store):
     mock_client.send_status_notification.assert_awaited_once()
 
 
-def test_inject_status_evse_state_updated(client, charger_in_store):
+async def test_inject_status_evse_state_updated(async_client, charger_in_store):
     """After successful injection, the EVSE state in the store reflects the new status."""
     _attach_mock_client(CP_ID)
-    from simulator_core.store import get_by_id as store_get
-    from simulator_core.evse import EvseState
+    evse = charger_in_store.get_evse(1)
 
-    r = client.post(
+    r = await async_client.post(
         f"/api/chargers/{CP_ID}/inject_status",
         json={"connector_id": 1, "status": "Unavailable"},
     )
     assert r.status_code == 204
-    assert store_get(CP_ID).get_evse(1).state == EvseState.Unavailable
+    assert evse.state == EvseState.Unavailable
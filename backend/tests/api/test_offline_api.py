@@ -1,10 +1,8 @@
 """API tests: offline mode endpoints — go-offline, go-online, and offline transaction support."""
-import uuid
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from repositories.location_repository import create_location
 from simulator_core.charger import CachedMessage
 from simulator_core.store import get_by_id as store_get
 
@@ -19,18 +17,7 @@ CP_ID = "CP-OFFLINE-TEST"
 
 
 @pytest.fixture
-def location(db_session):
-    loc_id = f"loc-offline-{uuid.uuid4().hex[:8]}"
-    return create_location(db_session, "Offline Test Location", "1 Test St", loc_id)
-
-
-@pytest.fixture
-def loc_id(location):
-    return location.id
-
-
-@pytest.fixture
-def charger_in_store(client, location, loc_id):
+def charger_in_store(client, module_location):
     """Create charger via API so it lands in the simulator store."""
     body = {
         "connection_url": "ws://example.com/ocpp",
@@ -39,7 +26,7 @@ def charger_in_store(client, location, loc_id):
         "ocpp_version": "1.6",
         "evse_count": 2,
     }
-    r = client.post(f"/api/locations/{loc_id}/chargers", json=body)
+    r = client.post(f"/api/locations/{module_location.id}/chargers", json=body)
     assert r.status_code == 201
     return r.json()
 
@@ -1,16 +1,14 @@
 """API tests: scenario endpoints."""
 from __future__ import annotations
 
-import uuid
-from unittest.mock import AsyncMock, MagicMock, patch
+import dataclasses
+from datetime import datetime, timezone
+from types import SimpleNamespace
 
 import pytest
 
-from repositories.location_repository import create_location
 from repositories.vehicle_repository import create_vehicle
-from simulator_core.scenario_engine import ScenarioRun, clear_all, set_active_scenario
-
-from datetime import datetime, timezone
+from simulator_core.scenario_engine import ScenarioRun, set_active_scenario
 
 pytestmark = pytest.mark.api
 
@@ -19,34 +17,69 @@ pytestmark = pytest.mark.api
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
-def location(db_session):
-    loc_id = f"loc-scen-{uuid.uuid4().hex[:8]}"
-    return create_location(db_session, "Scenario Test Location", "1 Scenario St", loc_id)
+@pytest.fixture(autouse=True)
+def _fresh_scenario_state(monkeypatch):
+    """Give each test an empty active-scenario map; monkeypatch restores the module's own dict afterwards."""
+    monkeypatch.setattr("simulator_core.scenario_engine._active", {})
 
 
-@pytest.fixture
-def loc_id(location):
-    return location.id
+_TEMPLATE = ScenarioRun(
+    location_id="",
+    scenario_type="rush_period",
+    duration_minutes=5,
+    started_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    total_pairs=3,
+    completed_pairs=1,
+    status="running",
+)
 
 
-@pytest.fixture(autouse=True)
-def reset_scenarios():
-    """Clear in-memory scenario state before and after each test."""
-    clear_all()
-    yield
-    clear_all()
+def _running_run(location_id: str) -> ScenarioRun:
+    """Copy of the running-scenario template for a location (fresh offline list so copies never share it)."""
+    return dataclasses.replace(_TEMPLATE, location_id=location_id, offline_charger_ids=[])
 
 
-def _running_run(location_id: str) -> ScenarioRun:
-    return ScenarioRun(
+class _OcppStub:
+    """Minimal OCPP client exposing only stop_transaction; records calls and optionally raises."""
+
+    def __init__(self, exc: Exception | None = None):
+        self.calls: list[int] = []
+        self._exc = exc
+
+    async def stop_transaction(self, evse_id: int) -> None:
+        self.calls.append(evse_id)
+        if self._exc is not None:
+            raise self._exc
+
+
+class _FakeStore:
+    """Stand-in for simulator_core.store exposing only get_all."""
+
+    def __init__(self, sims: list):
+        self._sims = sims
+
+    def get_all(self) -> list:
+        return self._sims
+
+
+async def _noop_run_rush_period(*args, **kwargs) -> None:
+    """Stand-in for run_rush_period; the rush-period tests only check the HTTP response."""
+    return None
+
+
+def _close_coro(coro) -> None:
+    """Replacement for asyncio.create_task that discards the coroutine without running it."""
+    coro.close()
+
+
+def _fake_sim(location_id: str, *, is_connected: bool, ocpp_client: _OcppStub | None = None) -> SimpleNamespace:
+    """Fake simulator charger with one EVSE holding an active transaction."""
+    return SimpleNamespace(
+        charge_point_id="CP-FAKE",
         location_id=location_id,
-        scenario_type="rush_period",
-        duration_minutes=5,
-        started_at=datetime.now(timezone.utc),
-        total_pairs=3,
-        completed_pairs=1,
-        status="running",
+        is_connected=is_connected,
+        evses=[SimpleNamespace(evse_id=1, transaction_id=42)],
+        _ocpp_client=ocpp_client,
     )
 
 
@@ -63,52 +96,52 @@ def test_start_rush_period_location_not_found(client):
     assert r.status_code == 404
 
 
-def test_start_rush_period_success(client, loc_id):
+def test_start_rush_period_success(client, shared_location, monkeypatch):
     """POST returns 202 and starts scenario in background."""
-    # Patch run_rush_period so it doesn't actually run
-    with patch("api.scenarios.run_rush_period", new=AsyncMock()) as mock_run, \
-         patch("asyncio.create_task"):
-        r = client.post(
-            f"/api/locations/{loc_id}/scenarios/rush-period",
-            json={"duration_minutes": 5},
-        )
+    # Stub run_rush_period so it doesn't actually run
+    monkeypatch.setattr("api.scenarios.run_rush_period", _noop_run_rush_period)
+    monkeypatch.setattr("asyncio.create_task", _close_coro)
+    r = client.post(
+        f"/api/locations/{shared_location.id}/scenarios/rush-period",
+        json={"duration_minutes": 5},
+    )
     assert r.status_code == 202
     data = r.json()
-    assert data["location_id"] == loc_id
+    assert data["location_id"] == shared_location.id
     assert data["scenario_type"] == "rush_period"
     assert data["duration_minutes"] == 5
     assert data["status"] == "running"
 
 
-def test_start_rush_period_conflict_409(client, loc_id):
+def test_start_rush_period_conflict_409(client, shared_location):
     """POST returns 409 if a scenario is already running."""
-    set_active_scenario(loc_id, _running_run(loc_id))
+    set_active_scenario(shared_location.id, _running_run(shared_location.id))
     r = client.post(
-        f"/api/locations/{loc_id}/scenarios/rush-period",
+        f"/api/locations/{shared_location.id}/scenarios/rush-period",
         json={"duration_minutes": 5},
     )
     assert r.status_code == 409
 
 
-def test_start_rush_period_allows_restart_after_completion(client, loc_id):
+def test_start_rush_period_allows_restart_after_completion(client, shared_location, monkeypatch):
     """POST succeeds if previous scenario is completed (not running)."""
-    completed = _running_run(loc_id)
+    completed = _running_run(shared_location.id)
     completed.status = "completed"
-    set_active_scenario(loc_id, completed)
-
-    with patch("api.scenarios.run_rush_period", new=AsyncMock()), \
-         patch("asyncio.create_task"):
-        r = client.post(
-            f"/api/locations/{loc_id}/scenarios/rush-period",
-            json={"duration_minutes": 3},
-        )
+    set_active_scenario(shared_location.id, completed)
+
+    monkeypatch.setattr("api.scenarios.run_rush_period", _noop_run_rush_period)
+    monkeypatch.setattr("asyncio.create_task", _close_coro)
+    r = client.post(
+        f"/api/locations/{shared_location.id}/scenarios/rush-period",
+        json={"duration_minutes": 3},
+    )
     assert r.status_code == 202
 
 
-def test_start_rush_period_invalid_duration(client, loc_id):
+def test_start_rush_period_invalid_duration(client, shared_location):
     """POST returns 422 for duration < 1."""
     r = client.post(
-        f"/api/locations/{loc_id}/scenarios/rush-period",
+        f"/api/locations/{shared_location.id}/scenarios/rush-period",
         json={"duration_minutes": 0},
     )
     assert r.status_code == 422
@@ -118,21 +151,21 @@ def test_start_rush_period_invalid_duration(client, loc_id):
 # GET /scenarios/active
 # ---------------------------------------------------------------------------
 
-def test_get_active_scenario_none(client, loc_id):
+def test_get_active_scenario_none(client, shared_location):
     """GET returns null when no scenario is active."""
-    r = client.get(f"/api/locations/{loc_id}/scenarios/active")
+    r = client.get(f"/api/locations/{shared_location.id}/scenarios/active")
     assert r.status_code == 200
     assert r.json() is None
 
 
-def test_get_active_scenario_running(client, loc_id):
+def test_get_active_scenario_running(client, shared_location):
     """GET returns the running scenario."""
-    set_active_scenario(loc_id, _running_run(loc_id))
-    r = client.get(f"/api/locations/{loc_id}/scenarios/active")
+    set_active_scenario(shared_location.id, _running_run(shared_location.id))
+    r = client.get(f"/api/locations/{shared_location.id}/scenarios/active")
     assert r.status_code == 200
     data = r.json()
     assert data["status"] == "running"
-    assert data["location_id"] == loc_id
+    assert data["location_id"] == shared_location.id
     assert data["total_pairs"] == 3
     assert data["completed_pairs"] == 1
 
@@ -141,19 +174,19 @@ def test_get_active_scenario_running(client, loc_id):
 # DELETE /scenarios/active
 # ---------------------------------------------------------------------------
 
-def test_cancel_active_scenario(client, loc_id):
+def test_cancel_active_scenario(client, shared_location):
     """DELETE returns 204 and clears the scenario."""
-    set_active_scenario(loc_id, _running_run(loc_id))
-    r = client.delete(f"/api/locations/{loc_id}/scenarios/active")
+    set_active_scenario(shared_location.id, _running_run(shared_location.id))
+    r = client.delete(f"/api/locations/{shared_location.id}/scenarios/active")
     assert r.status_code == 204
     # Scenario should now be gone
-    r2 = client.get(f"/api/locations/{loc_id}/scenarios/active")
+    r2 = client.get(f"/api/locations/{shared_location.id}/scenarios/active")
     assert r2.json() is None
 
 
-def test_cancel_when_no_active_scenario(client, loc_id):
+def test_cancel_when_no_active_scenario(client, shared_location):
     """DELETE is idempotent — no error when nothing is running."""
-    r = client.delete(f"/api/locations/{loc_id}/scenarios/active")
+    r = client.delete(f"/api/locations/{shared_location.id}/scenarios/active")
     assert r.status_code == 204
 
 
@@ -161,84 +194,28 @@ def test_cancel_when_no_active_scenario(client, loc_id):
 # POST /scenarios/stop-all-charging
 # ---------------------------------------------------------------------------
 
-def test_stop_all_charging_no_active_transactions(client, loc_id):
-    """POST returns 200 with stopped=0 when no EVSEs have active transactions."""
-    # No chargers in store for this location
-    with patch("api.scenarios.store") as mock_store:
-        mock_store.get_all.return_value = []
-        r = client.post(f"/api/locations/{loc_id}/scenarios/stop-all-charging")
-    assert r.status_code == 200
-    data = r.json()
-    assert data["stopped"] == 0
-    assert data["errors"] == 0
-
-
-def test_stop_all_charging_stops_active_evses(client, loc_id):
-    """POST calls stop_transaction for each EVSE with an active transaction."""
-    # Build fake charger with one active EVSE
-    mock_evse = MagicMock()
-    mock_evse.transaction_id = 42
-    mock_evse.evse_id = 1
-
-    mock_ocpp = AsyncMock()
-    mock_ocpp.stop_transaction = AsyncMock()
-
-    mock_sim = MagicMock()
-    mock_sim.location_id = loc_id
-    mock_sim.is_connected = True
-    mock_sim.evses = [mock_evse]
-    mock_sim._ocpp_client = mock_ocpp
-
-    with patch("api.scenarios.store") as mock_store:
-        mock_store.get_all.return_value = [mock_sim]
-        r = client.post(f"/api/locations/{loc_id}/scenarios/stop-all-charging")
-
-    assert r.status_code == 200
-    data = r.json()
-    assert data["stopped"] == 1
-    assert data["errors"] == 0
-    mock_ocpp.stop_transaction.assert_called_once_with(1)
-
-
-def test_stop_all_charging_skips_disconnected_chargers(client, loc_id):
-    """POST skips chargers that are not connected."""
-    mock_evse = MagicMock()
-    mock_evse.transaction_id = 1
-    mock_evse.evse_id = 1
-
-    mock_sim = MagicMock()
-    mock_sim.location_id = loc_id
-    mock_sim.is_connected = False
-    mock_sim.evses = [mock_evse]
-
-    with patch("api.scenarios.store") as mock_store:
-        mock_store.get_all.return_value = [mock_sim]
-        r = client.post(f"/api/locations/{loc_id}/scenarios/stop-all-charging")
-
-    assert r.status_code == 200
-    assert r.json()["stopped"] == 0
-
-
-def test_stop_all_charging_counts_errors(client, loc_id):
-    """POST counts errors when stop_transaction raises."""
-    mock_evse = MagicMock()
-    mock_evse.transaction_id = 1
-    mock_evse.evse_id = 1
-
-    mock_ocpp = AsyncMock()
-    mock_ocpp.stop_transaction = AsyncMock(side_effect=RuntimeError("CSMS gone"))
-
-    mock_sim = MagicMock()
-    mock_sim.location_id = loc_id
-    mock_sim.is_connected = True
-    mock_sim.evses = [mock_evse]
-    mock_sim._ocpp_client = mock_ocpp
-
-    with patch("api.scenarios.store") as mock_store:
-        mock_store.get_all.return_value = [mock_sim]
-        r = client.post(f"/api/locations/{loc_id}/scenarios/stop-all-charging")
+@pytest.mark.parametrize(
+    "connected,raises,expected_stopped,expected_errors",
+    [
+        pytest.param(None, None, 0, 0, id="no_active_transactions"),
+        pytest.param(True, None, 1, 0, id="stops_active_evses"),
+        pytest.param(False, None, 0, 0, id="skips_disconnected_chargers"),
+        pytest.param(True, RuntimeError("CSMS gone"), 0, 1, id="counts_errors"),
+    ],
+)
+def test_stop_all_charging(client, shared_location, monkeypatch, connected, raises, expected_stopped, expected_errors):
+    """POST calls stop_transaction for each active EVSE on connected chargers and counts failures.
+
+    connected=None means no chargers in the store for this location.
+    """
+    ocpp = _OcppStub(exc=raises)
+    sims = [] if connected is None else [_fake_sim(shared_location.id, is_connected=connected, ocpp_client=ocpp)]
+    monkeypatch.setattr("api.scenarios.store", _FakeStore(sims))
+
+    r = client.post(f"/api/locations/{shared_location.id}/scenarios/stop-all-charging")
 
     assert r.status_code == 200
     data = r.json()
-    assert data["stopped"] == 0
-    assert data["errors"] == 1
+    assert data["stopped"] == expected_stopped
+    assert data["errors"] == expected_errors
+    assert ocpp.calls == ([1] if connected else [])
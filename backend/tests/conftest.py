@@ -1,76 +1,176 @@
 # Set test environment before any application or db imports.
+import asyncio
 import os
+import sys
+import uuid
 
 os.environ["TESTING"] = "true"
 os.environ["TESTING_DATABASE_URL"] = "sqlite:///:memory:"
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import bindparam, create_engine, delete, event, insert
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from db import SessionLocal, get_db
 from main import app
 from models import Base
-from models.charger import Charger  # noqa: F401 - register with Base
-from models.evse import Evse  # noqa: F401
-from models.location import Location  # noqa: F401
-from models.vehicle import Vehicle  # noqa: F401
-from models.vehicle_id_tag import VehicleIdTag  # noqa: F401
 
 
-def _get_engine():
-    """Engine used by the app (in-memory when TESTING=true)."""
-    return SessionLocal.kw["bind"]
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop (C event loop); Windows, where uvloop is unavailable, keeps the default loop."""
+    if sys.platform == "win32":
+        return asyncio.DefaultEventLoopPolicy()
+    import uvloop
+
+    return uvloop.EventLoopPolicy()
+
+
+def _make_test_engine():
+    """Dedicated in-memory engine; StaticPool keeps one connection so every session sees the same schema and data."""
+    eng = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+
+    @event.listens_for(eng, "connect")
+    def _sqlite_fk(dbapi_conn, connection_record):
+        dbapi_conn.execute("PRAGMA foreign_keys=ON")
+
+    return eng
+
+
+def _register_models() -> None:
+    """Import every model so it registers with Base, then resolve relationships once."""
+    from models.charger import Charger  # noqa: F401
+    from models.evse import Evse  # noqa: F401
+    from models.location import Location  # noqa: F401
+    from models.vehicle import Vehicle  # noqa: F401
+    from models.vehicle_id_tag import VehicleIdTag  # noqa: F401
 
+    Base.registry.configure()
 
+
+# Session-scoped fixtures below are per worker under xdist: each worker process
+# builds its own in-memory engine, connection and shared location (safe under -n auto).
 @pytest.fixture(scope="session")
 def engine():
-    """One in-memory engine per test run; create tables once."""
-    eng = _get_engine()
+    """One in-memory engine per test run, bound to SessionLocal; create tables once."""
+    eng = _make_test_engine()
+    SessionLocal.configure(bind=eng)
+    _register_models()
     Base.metadata.create_all(eng)
-    return eng
+    yield eng
+    eng.dispose()
+
+
+@pytest.fixture(scope="session")
+def connection(engine):
+    """One connection for the whole run; its outer transaction is rolled back when the session ends."""
+    conn = engine.connect()
+    trans = conn.begin()
+    try:
+        yield conn
+    finally:
+        trans.rollback()
+        conn.close()
 
 
 @pytest.fixture
-def db_session(engine):
-    """Function-scoped session; each test runs in a transaction that is rolled back."""
-    connection = engine.connect()
-    trans = connection.begin()
-    session = Session(bind=connection)
-    session.begin_nested()
+def db_session(connection):
+    """Function-scoped session joined to the shared connection; each test runs in a SAVEPOINT that is rolled back.
+
+    ``create_savepoint`` makes ``session.commit()`` (used by the repositories) release a nested
+    savepoint instead of committing, so nothing a test writes escapes the per-test savepoint.
+    """
+    savepoint = connection.begin_nested()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
     try:
         yield session
     finally:
         session.close()
-        if trans.is_active:
-            trans.rollback()
-        connection.close()
+        if savepoint.is_active:
+            savepoint.rollback()
 
 
-def _override_get_db(session):
-    """Return a generator that yields the given session (for dependency override)."""
-    def override():
-        yield session
-    return override
+@pytest.fixture(scope="session")
+def _location_insert_stmt(engine):
+    """INSERT for test locations, built once per run and reused with bound parameters."""
+    from models.location import Location
+
+    return insert(Location).values(id=bindparam("id"), name=bindparam("name"), address=bindparam("address"))
+
+
+@pytest.fixture(scope="session")  # safe under -n auto: one row per worker DB
+def shared_location(connection, _location_insert_stmt):
+    """One location inserted in the outer transaction, visible to every test; for tests that only need *some* location."""
+    from models.location import Location
+
+    values = {"id": "loc-shared", "name": "Shared", "address": "1 Shared St"}
+    connection.execute(_location_insert_stmt, values)
+    return Location(**values)
+
+
+def _seed_key(module_name: str) -> str:
+    """Location id for a test module: the module's short name plus a random suffix, fresh on every call."""
+    return f"loc-{module_name.rsplit('.', 1)[-1]}-{uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture(scope="module")
+def module_location(request, connection, _location_insert_stmt):
+    """One location per test module, inserted in the outer transaction and deleted after the module's last test."""
+    from models.location import Location
+
+    values = {"id": _seed_key(request.module.__name__), "name": "Module Test Location", "address": "1 Test St"}
+    connection.execute(_location_insert_stmt, values)
+    yield Location(**values)
+    connection.execute(delete(Location).where(Location.id == values["id"]))
+
+
+# Session the API is currently served from; set by client/async_client around each test.
+_CURRENT_SESSION: list = [None]
+
+
+def _override_get_db():
+    """get_db override installed once per run; yields whichever test session is current."""
+    yield _CURRENT_SESSION[0]
+
+
+@pytest.fixture(scope="session")
+def _db_override():
+    """Install the get_db override for the whole run and remove it at the end."""
+    app.dependency_overrides[get_db] = _override_get_db
+    try:
+        yield
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture(scope="session")
+def _client_singleton(_db_override):
+    """One TestClient for the whole run, so app startup/shutdown happens once."""
+    with TestClient(app) as c:
+        yield c
 
 
 @pytest.fixture
-def client(db_session):
-    """API test client; overrides get_db to use the test db_session, cleared on teardown."""
-    app.dependency_overrides[get_db] = _override_get_db(db_session)
+def client(db_session, _client_singleton):
+    """API test client; get_db serves the test db_session until teardown."""
+    _CURRENT_SESSION[0] = db_session
     try:
-        with TestClient(app) as c:
+        yield _client_singleton
+    finally:
+        _CURRENT_SESSION[0] = None
+
+
+@pytest.fixture
+async def async_client(db_session, _db_override):
+    """Async API client for async endpoints; requests run on the test's own event loop (no TestClient portal)."""
+    _CURRENT_SESSION[0] = db_session
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
             yield c
     finally:
-        app.dependency_overrides.clear()
-
-
-def pytest_sessionfinish(session, exitstatus):
-    """Remove any temporary test DB files created during the run (e.g. under /tmp)."""
-    import glob
-    for pattern in ["/tmp/test_*.db", "test_*.db"]:
-        for path in glob.glob(pattern):
-            try:
-                os.remove(path)
-            except OSError:
-                pass
+        _CURRENT_SESSION[0] = None
+
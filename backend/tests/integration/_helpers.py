@@ -0,0 +1,35 @@
+"""Bulk-insert helpers for repository integration tests."""
+import uuid
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from models.charger import Charger
+from models.vehicle import Vehicle
+from models.vehicle_id_tag import VehicleIdTag
+
+
+def bulk_create_chargers(session: Session, rows: list[dict]) -> None:
+    """Insert charger rows in a single executemany (no EVSEs, no ORM objects returned)."""
+    session.execute(insert(Charger), rows)
+    session.flush()
+
+
+def bulk_create_vehicles(session: Session, rows: list[dict]) -> list[str]:
+    """Insert vehicles and their idTags with one executemany each; each row carries an ``id_tags`` list.
+
+    Vehicle ids are generated here (as the model default would) so no RETURNING is needed. Returns the ids in row order.
+    """
+    vehicle_rows = []
+    tag_rows = []
+    for row in rows:
+        row = dict(row)
+        id_tags = row.pop("id_tags")
+        vehicle_id = str(uuid.uuid4())
+        vehicle_rows.append({**row, "id": vehicle_id})
+        tag_rows.extend({"vehicle_id": vehicle_id, "id_tag": tag} for tag in id_tags)
+    session.execute(insert(Vehicle), vehicle_rows)
+    if tag_rows:
+        session.execute(insert(VehicleIdTag), tag_rows)
+    session.flush()
+    return [r["id"] for r in vehicle_rows]
@@ -2,12 +2,16 @@
 import uuid
 
 import pytest
+from sqlalchemy import event
 
+from models.charger import Charger as ChargerModel
+from repositories._batch import existing_values
 from repositories.charger_repository import (
     count_chargers_by_location,
     create_charger,
     delete_charger,
     get_charger_by_charge_point_id,
+    get_existing_charge_point_ids,
     list_chargers_by_location,
     list_all_chargers,
     list_evses_by_charger_id,
@@ -15,6 +19,7 @@ from repositories.charger_repository import (
     update_charger_config,
 )
 from repositories.location_repository import create_location
+from tests.integration._helpers import bulk_create_chargers
 
 pytestmark = pytest.mark.integration
 
@@ -45,33 +50,64 @@ def test_create_charger_and_get(db_session, loc_id):
     assert found.id == charger.id
 
 
-def test_get_charger_by_charge_point_id_not_found(db_session):
-    """get_charger_by_charge_point_id returns None for unknown id."""
-    assert get_charger_by_charge_point_id(db_session, "CP-NONE") is None
+@pytest.mark.parametrize(
+    "fn, args, expected",
+    [
+        (get_charger_by_charge_point_id, ("CP-NONE",), None),
+        (lambda s, cp_id: update_charger(s, cp_id, charger_name="X"), ("CP-NONE",), None),
+        (update_charger_config, ("CP-NONE", {"HeartbeatInterval": 60}), None),
+        (delete_charger, ("CP-NONE",), False),
+    ],
+    ids=["get", "update", "update_config", "delete"],
+)
+def test_charger_not_found(db_session, fn, args, expected):
+    """Lookups and mutations for an unknown charge_point_id return None (or False for delete)."""
+    assert fn(db_session, *args) is expected
 
 
 def test_list_chargers_by_location(db_session, loc_id):
     """list_chargers_by_location returns chargers for that location."""
-    create_charger(
-        db_session,
-        location_id=loc_id,
-        charge_point_id="CP-A",
-        connection_url="ws://a/ocpp",
-        charger_name="Charger A",
-    )
-    create_charger(
-        db_session,
-        location_id=loc_id,
-        charge_point_id="CP-B",
-        connection_url="ws://b/ocpp",
-        charger_name="Charger B",
-    )
+    bulk_create_chargers(db_session, [
+        {"location_id": loc_id, "charge_point_id": "CP-A", "connection_url": "ws://a/ocpp", "charger_name": "Charger A"},
+        {"location_id": loc_id, "charge_point_id": "CP-B", "connection_url": "ws://b/ocpp", "charger_name": "Charger B"},
+    ])
     chargers = list_chargers_by_location(db_session, loc_id)
     assert len(chargers) >= 2
     ids = [c.charge_point_id for c in chargers]
     assert "CP-A" in ids and "CP-B" in ids
 
 
+def test_get_existing_charge_point_ids(db_session, loc_id):
+    """get_existing_charge_point_ids returns only the ids that exist; empty input skips the query."""
+    bulk_create_chargers(db_session, [
+        {"location_id": loc_id, "charge_point_id": "CP-EX-1", "connection_url": "ws://a/ocpp", "charger_name": "Ex 1"},
+        {"location_id": loc_id, "charge_point_id": "CP-EX-2", "connection_url": "ws://b/ocpp", "charger_name": "Ex 2"},
+    ])
+    assert get_existing_charge_point_ids(db_session, ["CP-EX-1", "CP-EX-2", "CP-NEW"]) == {"CP-EX-1", "CP-EX-2"}
+    assert get_existing_charge_point_ids(db_session, []) == set()
+
+
+def test_existing_values_queries_in_chunks(db_session, loc_id):
+    """existing_values splits large lookups into IN queries of at most chunk_size values."""
+    bulk_create_chargers(db_session, [
+        {"location_id": loc_id, "charge_point_id": f"CP-CH-{i}", "connection_url": "ws://a/ocpp", "charger_name": f"Ch {i}"}
+        for i in range(5)
+    ])
+    wanted = [f"CP-CH-{i}" for i in range(0, 5, 2)] + [f"CP-MISSING-{i}" for i in range(1200)]
+    statements = []
+
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db_session.get_bind(), "before_cursor_execute", listener)
+    try:
+        found = existing_values(db_session, ChargerModel.charge_point_id, wanted, chunk_size=500)
+    finally:
+        event.remove(db_session.get_bind(), "before_cursor_execute", listener)
+    assert found == {"CP-CH-0", "CP-CH-2", "CP-CH-4"}
+    assert len(statements) == 3
+
+
 def test_update_charger(db_session, loc_id):
     """update_charger updates fields and returns the charger."""
     create_charger(
@@ -92,11 +128,6 @@ def test_update_charger(db_session, loc_id):
     assert updated.connection_url == "ws://y/ocpp"
 
 
-def test_update_charger_not_found(db_session):
-    """update_charger returns None for unknown charge_point_id."""
-    assert update_charger(db_session, "CP-NONE", charger_name="X") is None
-
-
 def test_update_charger_config(db_session, loc_id):
     """update_charger_config merges config and returns charger."""
     create_charger(
@@ -111,11 +142,6 @@ def test_update_charger_config(db_session, loc_id):
     assert updated.config.get("HeartbeatInterval") == 60
 
 
-def test_update_charger_config_not_found(db_session):
-    """update_charger_config returns None for unknown charge_point_id."""
-    assert update_charger_config(db_session, "CP-NONE", {"HeartbeatInterval": 60}) is None
-
-
 def test_delete_charger(db_session, loc_id):
     """delete_charger removes charger and returns True."""
     create_charger(
@@ -129,27 +155,12 @@ def test_delete_charger(db_session, loc_id):
     assert get_charger_by_charge_point_id(db_session, "CP-DEL") is None
 
 
-def test_delete_charger_not_found(db_session):
-    """delete_charger returns False for unknown charge_point_id."""
-    assert delete_charger(db_session, "CP-NONE") is False
-
-
 def test_count_chargers_by_location(db_session, loc_id):
     """count_chargers_by_location returns correct count."""
-    create_charger(
-        db_session,
-        location_id=loc_id,
-        charge_point_id="CP-CNT1",
-        connection_url="ws://x/ocpp",
-        charger_name="C1",
-    )
-    create_charger(
-        db_session,
-        location_id=loc_id,
-        charge_point_id="CP-CNT2",
-        connection_url="ws://x/ocpp",
-        charger_name="C2",
-    )
+    bulk_create_chargers(db_session, [
+        {"location_id": loc_id, "charge_point_id": "CP-CNT1", "connection_url": "ws://x/ocpp", "charger_name": "C1"},
+        {"location_id": loc_id, "charge_point_id": "CP-CNT2", "connection_url": "ws://x/ocpp", "charger_name": "C2"},
+    ])
     assert count_chargers_by_location(db_session, loc_id) >= 2
 
 
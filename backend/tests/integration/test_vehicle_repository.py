@@ -5,11 +5,14 @@ from repositories.location_repository import create_location
 from repositories.vehicle_repository import (
     create_vehicle,
     delete_vehicle,
+    get_existing_id_tags,
+    get_existing_vehicle_names,
     get_vehicle_by_id,
     get_vehicle_by_id_tag,
     get_vehicle_by_name,
     list_vehicles_by_location,
 )
+from tests.integration._helpers import bulk_create_vehicles
 
 pytestmark = pytest.mark.integration
 
@@ -39,9 +42,19 @@ def test_create_vehicle_and_get_by_id(db_session, loc_id):
     assert len(found.id_tags) >= 1
 
 
-def test_get_vehicle_by_id_not_found(db_session):
-    """get_vehicle_by_id returns None for unknown id."""
-    assert get_vehicle_by_id(db_session, "nonexistent-id") is None
+@pytest.mark.parametrize(
+    "fn, arg, expected",
+    [
+        (get_vehicle_by_id, "nonexistent-id", None),
+        (get_vehicle_by_id_tag, "UNKNOWN-TAG", None),
+        (get_vehicle_by_name, "No Such Name", None),
+        (delete_vehicle, "nonexistent-id", False),
+    ],
+    ids=["by_id", "by_id_tag", "by_name", "delete"],
+)
+def test_vehicle_not_found(db_session, fn, arg, expected):
+    """Lookups and delete for an unknown vehicle id, idTag or name return None (or False for delete)."""
+    assert fn(db_session, arg) is expected
 
 
 def test_get_vehicle_by_id_tag(db_session, loc_id):
@@ -58,11 +71,6 @@ def test_get_vehicle_by_id_tag(db_session, loc_id):
     assert vehicle.name == "Tag Vehicle"
 
 
-def test_get_vehicle_by_id_tag_not_found(db_session):
-    """get_vehicle_by_id_tag returns None for unknown tag."""
-    assert get_vehicle_by_id_tag(db_session, "UNKNOWN-TAG") is None
-
-
 def test_get_vehicle_by_name(db_session, loc_id):
     """get_vehicle_by_name returns vehicle with that name."""
     create_vehicle(
@@ -77,26 +85,25 @@ def test_get_vehicle_by_name(db_session, loc_id):
     assert vehicle.name == "Unique Name Vehicle"
 
 
-def test_get_vehicle_by_name_not_found(db_session):
-    """get_vehicle_by_name returns None for unknown name."""
-    assert get_vehicle_by_name(db_session, "No Such Name") is None
+def test_get_existing_vehicle_names_and_id_tags(db_session, loc_id):
+    """Batch existence lookups return only the names / idTags already taken."""
+    bulk_create_vehicles(
+        db_session,
+        [{"location_id": loc_id, "name": "Existing Vehicle", "battery_capacity_kwh": 70.0, "id_tags": ["EX-1", "EX-2"]}],
+    )
+    assert get_existing_vehicle_names(db_session, ["Existing Vehicle", "New Vehicle"]) == {"Existing Vehicle"}
+    assert get_existing_id_tags(db_session, ["EX-2", "NEW-1"]) == {"EX-2"}
+    assert get_existing_id_tags(db_session, []) == set()
 
 
 def test_list_vehicles_by_location(db_session, loc_id):
     """list_vehicles_by_location returns vehicles for that location."""
-    create_vehicle(
+    bulk_create_vehicles(
         db_session,
-        location_id=loc_id,
-        name="List Vehicle 1",
-        id_tags=["LV1"],
-        battery_capacity_kwh=70.0,
-    )
-    create_vehicle(
-        db_session,
-        location_id=loc_id,
-        name="List Vehicle 2",
-        id_tags=["LV2"],
-        battery_capacity_kwh=80.0,
+        [
+            {"location_id": loc_id, "name": "List Vehicle 1", "battery_capacity_kwh": 70.0, "id_tags": ["LV1"]},
+            {"location_id": loc_id, "name": "List Vehicle 2", "battery_capacity_kwh": 80.0, "id_tags": ["LV2"]},
+        ],
     )
     vehicles = list_vehicles_by_location(db_session, loc_id)
     names = [v.name for v in vehicles]
@@ -114,8 +121,3 @@ def test_delete_vehicle(db_session, loc_id):
     )
     assert delete_vehicle(db_session, vehicle.id) is True
     assert get_vehicle_by_id(db_session, vehicle.id) is None
-
-
-def test_delete_vehicle_not_found(db_session):
-    """delete_vehicle returns False for unknown id."""
-    assert delete_vehicle(db_session, "nonexistent-id") is False
@@ -0,0 +1,46 @@
+"""Virtual-time event loop for async unit tests: sleeps and timeouts complete without wall-clock waits."""
+import asyncio
+import selectors
+
+
+class _JumpingSelector:
+    """Selector wrapper that, when nothing is ready, advances the loop clock by the timeout instead of blocking."""
+
+    def __init__(self, selector: selectors.BaseSelector, loop: "VirtualClockEventLoop") -> None:
+        self._selector = selector
+        self._loop = loop
+
+    def select(self, timeout=None):
+        events = self._selector.select(0)
+        if events:
+            return events
+        if timeout is None:
+            # Nothing scheduled: only I/O can wake the loop, so block for real.
+            return self._selector.select(None)
+        self._loop._virtual_now += timeout
+        return events
+
+    def __getattr__(self, name):
+        return getattr(self._selector, name)
+
+
+class VirtualClockEventLoop(asyncio.SelectorEventLoop):
+    """Selector event loop whose time() is a counter that jumps straight to the next scheduled callback.
+
+    Only for code driven by timers (asyncio.sleep, wait_for timeouts); work handed to threads would see
+    timeouts fire early, because the clock does not wait for them.
+    """
+
+    def __init__(self) -> None:
+        self._virtual_now = 0.0
+        super().__init__(_JumpingSelector(selectors.DefaultSelector(), self))
+
+    def time(self) -> float:
+        return self._virtual_now
+
+
+class VirtualClockPolicy(asyncio.DefaultEventLoopPolicy):
+    """Event loop policy handing out VirtualClockEventLoop instances (for pytest-asyncio's event_loop_policy)."""
+
+    def new_event_loop(self) -> asyncio.AbstractEventLoop:
+        return VirtualClockEventLoop()
@@ -0,0 +1,30 @@
+"""Fixtures shared by the unit tests."""
+import copy
+
+import pytest
+
+from simulator_core.evse import EVSE
+
+
+@pytest.fixture(scope="module")
+def ac_evse_shared():
+    """AC EVSE built once per module; only for tests that read from it."""
+    return EVSE(evse_id=1, power_type="AC")
+
+
+@pytest.fixture(scope="module")
+def dc_evse_shared():
+    """DC EVSE built once per module; only for tests that read from it."""
+    return EVSE(evse_id=1, power_type="DC")
+
+
+@pytest.fixture
+def ac_evse(ac_evse_shared):
+    """Per-test copy of the shared AC EVSE, safe to mutate."""
+    return copy.copy(ac_evse_shared)
+
+
+@pytest.fixture
+def dc_evse(dc_evse_shared):
+    """Per-test copy of the shared DC EVSE, safe to mutate."""
+    return copy.copy(dc_evse_shared)
@@ -0,0 +1,37 @@
+"""Unit tests: utils.config cached environment getters."""
+import pytest
+
+from utils.config import DATABASE_URL, clear_config_cache, get_database_url, get_port
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def fresh_config(monkeypatch):
+    """Clear the getter caches around a test so env overrides are picked up and then forgotten."""
+    clear_config_cache()
+    yield monkeypatch
+    monkeypatch.undo()
+    clear_config_cache()
+
+
+def test_database_url_is_test_url():
+    """Under TESTING=true the module constant comes from TESTING_DATABASE_URL."""
+    assert DATABASE_URL == get_database_url() == "sqlite:///:memory:"
+
+
+def test_getters_cache_until_cleared(fresh_config):
+    """Getters read the environment once; clear_config_cache() makes them re-read it."""
+    fresh_config.setenv("PORT", "9100")
+    assert get_port() == 9100
+    fresh_config.setenv("PORT", "9200")
+    assert get_port() == 9100
+    clear_config_cache()
+    assert get_port() == 9200
+
+
+def test_database_url_outside_testing(fresh_config):
+    """Without TESTING=true, DATABASE_URL (or the file default) is used."""
+    fresh_config.delenv("TESTING")
+    fresh_config.setenv("DATABASE_URL", "postgresql://db/sim")
+    assert get_database_url() == "postgresql://db/sim"
@@ -1,6 +1,4 @@
 """Unit tests: config_sync (persist_charger_config)."""
-from unittest.mock import MagicMock, patch
-
 import pytest
 
 from simulator_core.config_sync import persist_charger_config
@@ -8,32 +6,56 @@ from simulator_core.config_sync import persist_charger_config
 pytestmark = pytest.mark.unit
 
 
-def test_persist_charger_config_calls_update():
+class _StubDB:
+    """Stand-in for a SessionLocal session; only counts close() calls."""
+
+    def __init__(self):
+        self.closed = 0
+
+    def close(self):
+        self.closed += 1
+
+
+@pytest.fixture
+def stub_db(monkeypatch):
+    """Route persist_charger_config's SessionLocal() to a fresh _StubDB."""
+    db = _StubDB()
+    monkeypatch.setattr("simulator_core.config_sync.SessionLocal", lambda: db)
+    return db
+
+
+def _stub_update(result=None, exc=None):
+    """update_charger_config replacement that records (db, charge_point_id, updates) and returns or raises."""
+    calls = []
+
+    def _update(db, charge_point_id, updates):
+        calls.append((db, charge_point_id, updates))
+        if exc is not None:
+            raise exc
+        return result
+
+    _update.calls = calls
+    return _update
+
+
+def test_persist_charger_config_calls_update(stub_db, monkeypatch):
     """persist_charger_config calls update_charger_config with session."""
-    mock_db = MagicMock()
-    with patch("simulator_core.config_sync.SessionLocal", return_value=mock_db):
-        with patch("simulator_core.config_sync.update_charger_config") as mock_update:
-            mock_update.return_value = MagicMock()
-            persist_charger_config("CP-SYNC", {"HeartbeatInterval": 60})
-            mock_update.assert_called_once()
-            assert mock_update.call_args[0][1] == "CP-SYNC"
-            assert mock_update.call_args[0][2] == {"HeartbeatInterval": 60}
-    mock_db.close.assert_called_once()
-
-
-def test_persist_charger_config_handles_not_found():
+    update = _stub_update(result=object())
+    monkeypatch.setattr("simulator_core.config_sync.update_charger_config", update)
+    persist_charger_config("CP-SYNC", {"HeartbeatInterval": 60})
+    assert update.calls == [(stub_db, "CP-SYNC", {"HeartbeatInterval": 60})]
+    assert stub_db.closed == 1
+
+
+def test_persist_charger_config_handles_not_found(stub_db, monkeypatch):
     """persist_charger_config closes db when charger not found."""
-    mock_db = MagicMock()
-    with patch("simulator_core.config_sync.SessionLocal", return_value=mock_db):
-        with patch("simulator_core.config_sync.update_charger_config", return_value=None):
-            persist_charger_config("CP-NONE", {"HeartbeatInterval": 60})
-    mock_db.close.assert_called_once()
+    monkeypatch.setattr("simulator_core.config_sync.update_charger_config", _stub_update(result=None))
+    persist_charger_config("CP-NONE", {"HeartbeatInterval": 60})
+    assert stub_db.closed == 1
 
 
-def test_persist_charger_config_closes_db_on_exception():
+def test_persist_charger_config_closes_db_on_exception(stub_db, monkeypatch):
     """persist_charger_config closes db even when update raises."""
-    mock_db = MagicMock()
-    with patch("simulator_core.config_sync.SessionLocal", return_value=mock_db):
-        with patch("simulator_core.config_sync.update_charger_config", side_effect=RuntimeError("db error")):
-            persist_charger_config("CP-ERR", {})
-    mock_db.close.assert_called_once()
+    monkeypatch.setattr("simulator_core.config_sync.update_charger_config", _stub_update(exc=RuntimeError("db error")))
+    persist_charger_config("CP-ERR", {})
+    assert stub_db.closed == 1
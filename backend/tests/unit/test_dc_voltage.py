@@ -6,45 +6,33 @@ from simulator_core.dc_voltage import DEFAULT_CELLS, get_pack_voltage_V, ocv_fro
 pytestmark = pytest.mark.unit
 
 
-def test_ocv_from_soc_zero():
-    """At 0% SOC, cell voltage reflects the sigmoid plateau (~3.9V)."""
-    voltage = ocv_from_soc(0.0)
-    assert 3.85 <= voltage <= 3.95
+# Uniform 128-point SOC grid over [0, 1].
+_SOC_GRID = [i / 127 for i in range(128)]
 
+# Cell OCV at every 0.1% SOC step, computed once at import: OCV_TABLE[int(soc_pct * 10)].
+OCV_TABLE = tuple(ocv_from_soc(s / 1000) for s in range(1001))
 
-def test_ocv_from_soc_full():
-    """At 100% SOC, cell voltage is near Vmax (~4.15V)."""
-    voltage = ocv_from_soc(1.0)
-    assert 4.1 <= voltage <= 4.2
 
-
-def test_ocv_from_soc_mid():
-    """At 50% SOC, cell voltage is at the sigmoid midpoint (~4.025V)."""
-    voltage = ocv_from_soc(0.5)
-    assert 4.0 <= voltage <= 4.1
-
-
-def test_ocv_increases_with_soc():
-    """OCV increases monotonically with SOC."""
-    soc_values = [0.0, 0.2, 0.4, 0.6, 0.8, 1.0]
-    voltages = [ocv_from_soc(soc) for soc in soc_values]
-    for i in range(1, len(voltages)):
-        assert voltages[i] > voltages[i - 1]
+def test_ocv_curve_properties():
+    """OCV rises monotonically over the SOC grid: ~3.9V at 0%, ~4.025V mid-curve, near Vmax (~4.15V) at 100%."""
+    v = [ocv_from_soc(soc) for soc in _SOC_GRID]
+    assert all(b > a for a, b in zip(v, v[1:]))
+    assert 3.85 <= v[0] <= 3.95
+    assert 4.0 <= v[64] <= 4.1
+    assert 4.1 <= v[-1] <= 4.2
 
 
 def test_get_pack_voltage_V_default_cells():
     """get_pack_voltage_V uses 108 cells by default."""
     assert DEFAULT_CELLS == 108
     pack_voltage = get_pack_voltage_V(50.0)
-    cell_voltage = ocv_from_soc(0.5)
-    assert abs(pack_voltage - cell_voltage * 108) < 0.01
+    assert abs(pack_voltage - OCV_TABLE[500] * 108) < 0.01
 
 
 def test_get_pack_voltage_V_custom_cells():
     """get_pack_voltage_V can use custom cell count."""
     pack_voltage = get_pack_voltage_V(50.0, cells=96)
-    cell_voltage = ocv_from_soc(0.5)
-    assert abs(pack_voltage - cell_voltage * 96) < 0.01
+    assert abs(pack_voltage - OCV_TABLE[500] * 96) < 0.01
 
 
 def test_get_pack_voltage_V_at_20_soc():
@@ -68,3 +56,9 @@ def test_get_pack_voltage_V_clamps_soc():
     high = get_pack_voltage_V(110.0)
     hundred = get_pack_voltage_V(100.0)
     assert abs(high - hundred) < 0.01
+
+
+def test_get_pack_voltage_V_interpolation_matches_model():
+    """Table interpolation stays within 1 mV of the analytic sigmoid between grid points."""
+    for soc_pct in (0.05, 12.34, 49.99, 50.05, 77.77, 99.95):
+        assert abs(get_pack_voltage_V(soc_pct) - ocv_from_soc(soc_pct / 100.0) * DEFAULT_CELLS) < 0.001
@@ -19,59 +19,68 @@ def test_parse_csv_one_row():
     assert rows[0]["name"] == "V1" and rows[0]["idTag"] == "TAG1"
 
 
-def test_parse_csv_charger_format_normalizes_evse_count():
-    """parse_csv with charger_format normalizes number_of_evses to evse_count."""
-    content = b"connection_url,charger_name,charge_point_id,number_of_evses\nws://x/o,C1,CP1,2\n"
-    rows = parse_csv(content, charger_format=True)
-    assert rows[0].get("evse_count") == "2"
-    assert "number_of_evses" not in rows[0]
-
-
-def test_parse_json_array():
-    """parse_json returns list of dicts from JSON array."""
-    content = b'[{"name":"V1","idTag":"T1","battery_capacity_kWh":60}]'
-    rows = parse_json(content)
-    assert len(rows) == 1 and rows[0]["name"] == "V1"
-
-
-def test_parse_json_not_array_raises():
-    """parse_json with non-array raises ValueError."""
-    with pytest.raises(ValueError, match="array"):
-        parse_json(b'{"x":1}')
+def test_parse_csv_strips_cells_and_drops_blank_and_extra_columns():
+    """parse_csv strips headers and values, drops blank headers and cells beyond the header row."""
+    content = b" name , ,idTag\n V1 ,ignored, TAG1 ,extra\n"
+    assert parse_csv(content) == [{"name": "V1", "idTag": "TAG1"}]
 
 
-def test_parse_upload_detects_csv_by_filename():
-    """parse_upload with .csv filename uses parse_csv."""
-    rows = parse_upload(b"a,b\n1,2\n", "file.csv")
-    assert len(rows) == 1 and rows[0]["a"] == "1"
+def test_parse_csv_short_rows_and_blank_lines():
+    """Missing trailing cells become None (as DictReader's restval); blank lines are skipped."""
+    content = b"name,idTag,battery_capacity_kWh\n\nV1,TAG1\n"
+    assert parse_csv(content) == [{"name": "V1", "idTag": "TAG1", "battery_capacity_kWh": None}]
 
 
-def test_parse_upload_detects_json_by_filename():
-    """parse_upload with .json filename uses parse_json."""
-    rows = parse_upload(b'[{"a":1}]', "file.json")
-    assert len(rows) == 1 and rows[0]["a"] == 1
+def test_parse_csv_crlf_quoted_newline_and_invalid_utf8():
+    """CRLF line endings and newlines inside quoted cells are handled; invalid UTF-8 is replaced, not raised."""
+    content = b'name,idTag\r\n"V\r\n1",T\xff1\r\n'
+    assert parse_csv(content) == [{"name": "V\r\n1", "idTag": "T\ufffd1"}]
 
 
-def test_parse_json_row_not_object_raises():
-    """parse_json with non-object element raises ValueError."""
-    with pytest.raises(ValueError, match="not an object"):
-        parse_json(b"[1,2]")
-
-
-def test_parse_json_skips_empty_normalized():
-    """parse_json skips items that normalize to empty (all keys empty after strip)."""
-    content = b'[{"  ":"x","   ":""}]'
-    rows = parse_json(content)
-    assert len(rows) == 0
-
-
-def test_parse_upload_detects_json_by_content():
-    """parse_upload with unknown ext but content [ uses JSON."""
-    rows = parse_upload(b'[{"x":1}]', "file.txt")
-    assert len(rows) == 1 and rows[0]["x"] == 1
+def test_parse_csv_charger_format_normalizes_evse_count():
+    """parse_csv with charger_format normalizes number_of_evses to evse_count."""
+    content = b"connection_url,charger_name,charge_point_id,number_of_evses\nws://x/o,C1,CP1,2\n"
+    rows = parse_csv(content, charger_format=True)
+    assert rows[0].get("evse_count") == "2"
+    assert "number_of_evses" not in rows[0]
 
 
-def test_parse_upload_fallback_csv():
-    """parse_upload with no .json and content not [ uses CSV."""
-    rows = parse_upload(b"x,y\n1,2\n", "file.dat")
-    assert len(rows) == 1 and rows[0]["x"] == "1"
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        (b'[{"name":"V1","idTag":"T1","battery_capacity_kWh":60}]', [{"name": "V1", "idTag": "T1", "battery_capacity_kWh": 60}]),
+        # Items whose keys are all empty after strip are skipped
+        (b'[{"  ":"x","   ":""}]', []),
+    ],
+    ids=["array", "skips_empty_normalized"],
+)
+def test_parse_json(content, expected):
+    """parse_json returns list of dicts from a JSON array, skipping rows that normalize to empty."""
+    assert parse_json(content) == expected
+
+
+@pytest.mark.parametrize(
+    "content, match",
+    [(b'{"x":1}', "array"), (b"[1,2]", "not an object"), (b'[{"a":1}', "unexpected end of data")],
+    ids=["not_array", "row_not_object", "invalid_json"],
+)
+def test_parse_json_raises(content, match):
+    """parse_json raises ValueError for a non-array body, a non-object element or malformed JSON."""
+    with pytest.raises(ValueError, match=match):
+        parse_json(content)
+
+
+@pytest.mark.parametrize(
+    "content, filename, expected_first",
+    [
+        (b"a,b\n1,2\n", "file.csv", {"a": "1", "b": "2"}),
+        (b'[{"a":1}]', "file.json", {"a": 1}),
+        (b'[{"x":1}]', "file.txt", {"x": 1}),
+        (b"x,y\n1,2\n", "file.dat", {"x": "1", "y": "2"}),
+    ],
+    ids=["csv_by_filename", "json_by_filename", "json_by_content", "fallback_csv"],
+)
+def test_parse_upload_dispatch(content, filename, expected_first):
+    """parse_upload picks CSV/JSON by extension, then by a leading '[', falling back to CSV."""
+    rows = parse_upload(content, filename)
+    assert rows == [expected_first]
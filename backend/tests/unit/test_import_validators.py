@@ -1,72 +1,114 @@
 """Unit tests: import validators (charger and vehicle row validation)."""
 import pytest
 
-from repositories.location_repository import create_location
+from repositories.charger_repository import create_charger
 from repositories.vehicle_repository import create_vehicle
-from utils.import_validators import validate_charger_row, validate_vehicle_row
+from utils.import_validators import (
+    _ERROR_TEMPLATES,
+    _get_positive_int,
+    existing_charge_point_ids,
+    existing_vehicle_keys,
+    format_import_error,
+    ImportErrorCode,
+    validate_charger_row,
+    validate_vehicle_row,
+)
 
 pytestmark = pytest.mark.unit
 
 
-@pytest.fixture
-def loc_id(db_session):
-    """Create a location for validator tests (unique per test)."""
-    import uuid
-    lid = f"loc-valid-{uuid.uuid4().hex[:8]}"
-    loc = create_location(db_session, "Validator Loc", "1 St", lid)
-    return loc.id
-
-
-def test_validate_charger_row_success(db_session, loc_id):
-    """validate_charger_row with valid row returns (True, normalized, '')."""
+def test_validate_charger_row_success(module_location):
+    """validate_charger_row with valid row returns (True, normalized, None, ())."""
     row = {"connection_url": "ws://x/ocpp", "charger_name": "Charger", "charge_point_id": "CP-VALID"}
-    ok, norm, err = validate_charger_row(row, loc_id, db_session)
-    assert ok is True and norm is not None and norm["charge_point_id"] == "CP-VALID" and err == ""
+    ok, norm, code, args = validate_charger_row(row, module_location.id, set())
+    assert ok is True and norm is not None and norm["charge_point_id"] == "CP-VALID"
+    assert code is None and args == ()
 
 
-def test_validate_charger_row_missing_connection_url(db_session, loc_id):
+def test_validate_charger_row_missing_connection_url(module_location):
     """validate_charger_row without connection_url returns error."""
     row = {"charger_name": "C", "charge_point_id": "CP"}
-    ok, norm, err = validate_charger_row(row, loc_id, db_session)
-    assert ok is False and "connection_url" in err
+    ok, norm, code, args = validate_charger_row(row, module_location.id, set())
+    assert ok is False and code is ImportErrorCode.CONNECTION_URL_REQUIRED
+    assert format_import_error(code, args) == "connection_url is required"
 
 
-def test_validate_charger_row_default_connection_url(db_session, loc_id):
+def test_validate_charger_row_default_connection_url(module_location):
     """validate_charger_row uses default_connection_url when connection_url missing."""
     row = {"charger_name": "C", "charge_point_id": "CP-DEF"}
-    ok, norm, _ = validate_charger_row(row, loc_id, db_session, default_connection_url="ws://default/ocpp")
+    ok, norm, _, _ = validate_charger_row(row, module_location.id, set(), default_connection_url="ws://default/ocpp")
     assert ok is True and norm["connection_url"] == "ws://default/ocpp"
 
 
-def test_validate_vehicle_row_success(db_session, loc_id):
-    """validate_vehicle_row with valid row returns (True, normalized, '')."""
+def test_validate_vehicle_row_success(module_location):
+    """validate_vehicle_row with valid row returns (True, normalized, None, ())."""
     row = {"name": "Vehicle One", "idTag": "TAG-V1", "battery_capacity_kWh": 75}
-    ok, norm, err = validate_vehicle_row(row, db_session)
-    assert ok is True and norm["name"] == "Vehicle One" and norm["id_tags"] == ["TAG-V1"] and err == ""
+    ok, norm, code, args = validate_vehicle_row(row, set(), set())
+    assert ok is True and norm["name"] == "Vehicle One" and norm["id_tags"] == ["TAG-V1"]
+    assert code is None and args == ()
 
 
-def test_validate_vehicle_row_missing_name(db_session):
+def test_validate_vehicle_row_missing_name():
     """validate_vehicle_row without name returns error."""
-    ok, _, err = validate_vehicle_row({"idTag": "T1", "battery_capacity_kWh": 50}, db_session)
-    assert ok is False and "name" in err
+    ok, _, code, _ = validate_vehicle_row({"idTag": "T1", "battery_capacity_kWh": 50}, set(), set())
+    assert ok is False and code is ImportErrorCode.NAME_REQUIRED
 
 
-def test_validate_vehicle_row_invalid_battery(db_session):
+def test_validate_vehicle_row_invalid_battery():
     """validate_vehicle_row with non-numeric battery returns error."""
-    ok, _, err = validate_vehicle_row({"name": "V", "idTag": "T1", "battery_capacity_kWh": "x"}, db_session)
-    assert ok is False
+    ok, _, code, _ = validate_vehicle_row({"name": "V", "idTag": "T1", "battery_capacity_kWh": "x"}, set(), set())
+    assert ok is False and code is ImportErrorCode.BATTERY_NOT_NUMERIC
 
 
-def test_validate_charger_row_evse_count_invalid(db_session, loc_id):
+def test_validate_charger_row_evse_count_invalid(module_location):
     """validate_charger_row with invalid evse_count returns error."""
     row = {"connection_url": "ws://x", "charger_name": "C", "charge_point_id": "CP-X", "evse_count": "x"}
-    ok, norm, err = validate_charger_row(row, loc_id, db_session)
-    assert ok is False and "integer" in err
+    ok, norm, code, args = validate_charger_row(row, module_location.id, set())
+    assert ok is False and code is ImportErrorCode.EVSE_COUNT_INVALID
+    assert "integer" in format_import_error(code, args)
+
+
+@pytest.mark.parametrize(
+    "evse_count, expected",
+    [(3, 3), ("2", 2), (" 4 ", 4), (0, None), ("-1", None), (True, None), ("two", None)],
+)
+def test_get_positive_int(evse_count, expected):
+    """_get_positive_int accepts ints and integer strings >= 1; rejects booleans, non-positive and non-numeric values."""
+    assert _get_positive_int({"evse_count": evse_count}, "evse_count") == expected
 
 
-def test_validate_vehicle_row_duplicate_id_tag(db_session, loc_id):
+# The prefetch tests below write real DB rows; keep them on one xdist worker.
+@pytest.mark.serial
+@pytest.mark.xdist_group("serial")
+def test_validate_vehicle_row_duplicate_id_tag(db_session, module_location):
     """validate_vehicle_row returns error when idTag already exists."""
-    create_vehicle(db_session, location_id=loc_id, name="Other", id_tags=["TAG-TAKEN"], battery_capacity_kwh=70.0)
-    row = {"name": "New V", "idTag": "TAG-TAKEN", "battery_capacity_kWh": 50}
-    ok, _, err = validate_vehicle_row(row, db_session)
-    assert ok is False and "idTag" in err
+    create_vehicle(db_session, location_id=module_location.id, name="Other", id_tags=["TAG-TAKEN"], battery_capacity_kwh=70.0)
+    row = {"name": "New V", "idTag": "TAG-NEW, TAG-TAKEN", "battery_capacity_kWh": 50}
+    names, id_tags = existing_vehicle_keys([row], db_session)
+    assert names == set() and id_tags == {"TAG-TAKEN"}
+    ok, _, code, args = validate_vehicle_row(row, names, id_tags)
+    assert ok is False and code is ImportErrorCode.DUPLICATE_ID_TAG and args == ("TAG-TAKEN",)
+    assert format_import_error(code, args) == "vehicle with idTag 'TAG-TAKEN' already exists"
+
+
+@pytest.mark.serial
+@pytest.mark.xdist_group("serial")
+def test_validate_charger_row_duplicate_charge_point_id(db_session, module_location):
+    """validate_charger_row returns error when the charge_point_id is among the prefetched existing ids."""
+    create_charger(db_session, location_id=module_location.id, charge_point_id="CP-TAKEN", connection_url="ws://x", charger_name="T")
+    rows = [
+        {"connection_url": "ws://x", "charger_name": "C", "charge_point_id": "CP-TAKEN"},
+        {"connection_url": "ws://x", "charger_name": "C", "charge_point_id": "CP-FREE"},
+    ]
+    existing = existing_charge_point_ids(rows, db_session)
+    assert existing == {"CP-TAKEN"}
+    ok, _, code, args = validate_charger_row(rows[0], module_location.id, existing)
+    assert ok is False and code is ImportErrorCode.DUPLICATE_CHARGE_POINT_ID and args == ("CP-TAKEN",)
+    assert format_import_error(code, args) == "charger already exists with charge_point_id 'CP-TAKEN'"
+    assert validate_charger_row(rows[1], module_location.id, existing)[0] is True
+
+
+def test_format_import_error_covers_every_code():
+    """Every ImportErrorCode has a message template; arguments are substituted only when formatting."""
+    assert set(_ERROR_TEMPLATES) == set(ImportErrorCode)
+    assert format_import_error(ImportErrorCode.POWER_TYPE_INVALID, ("XX",)) == "power_type must be 'AC' or 'DC', got 'XX'"
@@ -1,28 +1,33 @@
 """Unit tests: send_status_notification extended signature (error_code, info, vendor_error_code)."""
+from unittest.mock import MagicMock
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from ocpp.v16.enums import ChargePointErrorCode, ChargePointStatus
+
+from simulator_core.evse import EvseState
+from simulator_core.ocpp_client import SimulatorChargePoint
 
 pytestmark = pytest.mark.unit
 
 
 def _make_cp():
     """Create a SimulatorChargePoint with a mocked WebSocket connection."""
-    from simulator_core.ocpp_client import SimulatorChargePoint
     mock_conn = MagicMock()
     mock_conn.open = True
     return SimulatorChargePoint("CP-UNIT-TEST", mock_conn)
 
 
-async def _call_send(cp, connector_id, status, **kwargs):
-    """Helper: patch self.call and invoke send_status_notification, returning the payload."""
+@pytest.fixture
+def cp_with_capture(monkeypatch):
+    """SimulatorChargePoint whose ``call`` records the request instead of sending it; returns (cp, captured)."""
+    cp = _make_cp()
     captured = {}
 
     async def _capture(req):
         captured["req"] = req
 
-    with patch.object(cp, "call", side_effect=_capture):
-        await cp.send_status_notification(connector_id, status, **kwargs)
-    return captured["req"]
+    monkeypatch.setattr(cp, "call", _capture)
+    return cp, captured
 
 
 # ---------------------------------------------------------------------------
@@ -31,23 +36,20 @@ async def _call_send(cp, connector_id, status, **kwargs):
 
 
 @pytest.mark.asyncio
-async def test_default_error_code_is_no_error():
+async def test_default_error_code_is_no_error(cp_with_capture):
     """Omitting error_code defaults to no_error — existing callers are unaffected."""
-    from ocpp.v16.enums import ChargePointErrorCode
-    from simulator_core.evse import EvseState
-
-    cp = _make_cp()
-    req = await _call_send(cp, 1, EvseState.Available)
+    cp, captured = cp_with_capture
+    await cp.send_status_notification(1, EvseState.Available)
+    req = captured["req"]
     assert req.error_code == ChargePointErrorCode.no_error
 
 
 @pytest.mark.asyncio
-async def test_no_info_no_vendor_by_default():
+async def test_no_info_no_vendor_by_default(cp_with_capture):
     """Without info/vendor_error_code, payload fields are None."""
-    from simulator_core.evse import EvseState
-
-    cp = _make_cp()
-    req = await _call_send(cp, 1, EvseState.Available)
+    cp, captured = cp_with_capture
+    await cp.send_status_notification(1, EvseState.Available)
+    req = captured["req"]
     assert getattr(req, "info", None) is None
     assert getattr(req, "vendor_error_code", None) is None
 
@@ -58,62 +60,54 @@ async def test_no_info_no_vendor_by_default():
 
 
 @pytest.mark.asyncio
-async def test_passes_error_code():
+async def test_passes_error_code(cp_with_capture):
     """Provided error_code is forwarded to the OCPP payload."""
-    from ocpp.v16.enums import ChargePointErrorCode
-    from simulator_core.evse import EvseState
-
-    cp = _make_cp()
-    req = await _call_send(
-        cp, 1, EvseState.Faulted,
+    cp, captured = cp_with_capture
+    await cp.send_status_notification(
+        1, EvseState.Faulted,
         error_code=ChargePointErrorCode.internal_error,
     )
+    req = captured["req"]
     assert req.error_code == ChargePointErrorCode.internal_error
 
 
 @pytest.mark.asyncio
-async def test_passes_info():
+async def test_passes_info(cp_with_capture):
     """Provided info string is forwarded to the OCPP payload."""
-    from ocpp.v16.enums import ChargePointErrorCode
-    from simulator_core.evse import EvseState
-
-    cp = _make_cp()
-    req = await _call_send(
-        cp, 1, EvseState.Faulted,
+    cp, captured = cp_with_capture
+    await cp.send_status_notification(
+        1, EvseState.Faulted,
         error_code=ChargePointErrorCode.ground_failure,
         info="Thermal runaway detected",
     )
+    req = captured["req"]
     assert req.info == "Thermal runaway detected"
 
 
 @pytest.mark.asyncio
-async def test_passes_vendor_error_code():
+async def test_passes_vendor_error_code(cp_with_capture):
     """Provided vendor_error_code is forwarded to the OCPP payload."""
-    from ocpp.v16.enums import ChargePointErrorCode
-    from simulator_core.evse import EvseState
-
-    cp = _make_cp()
-    req = await _call_send(
-        cp, 1, EvseState.Faulted,
+    cp, captured = cp_with_capture
+    await cp.send_status_notification(
+        1, EvseState.Faulted,
         error_code=ChargePointErrorCode.internal_error,
         vendor_error_code="VE-42",
     )
+    req = captured["req"]
     assert req.vendor_error_code == "VE-42"
 
 
 @pytest.mark.asyncio
-async def test_passes_all_extended_params_together():
+async def test_passes_all_extended_params_together(cp_with_capture):
     """error_code, info, and vendor_error_code all forwarded correctly."""
-    from ocpp.v16.enums import ChargePointErrorCode
-    from simulator_core.evse import EvseState
-
-    cp = _make_cp()
-    req = await _call_send(
-        cp, 2, EvseState.Faulted,
+    cp, captured = cp_with_capture
+    await cp.send_status_notification(
+        2, EvseState.Faulted,
         error_code=ChargePointErrorCode.over_voltage,
         info="voltage spike",
         vendor_error_code="OV-001",
     )
+    req = captured["req"]
     assert req.error_code == ChargePointErrorCode.over_voltage
     assert req.info == "voltage spike"
     assert req.vendor_error_code == "OV-001"
@@ -121,11 +115,9 @@ async def test_passes_all_extended_params_together():
 
 
 @pytest.mark.asyncio
-async def test_correct_ocpp_status_mapped():
+async def test_correct_ocpp_status_mapped(cp_with_capture):
     """EVSE state is correctly mapped to OCPP ChargePointStatus in the payload."""
-    from ocpp.v16.enums import ChargePointStatus
-    from simulator_core.evse import EvseState
-
-    cp = _make_cp()
-    req = await _call_send(cp, 1, EvseState.Unavailable)
+    cp, captured = cp_with_capture
+    await cp.send_status_notification(1, EvseState.Unavailable)
+    req = captured["req"]
     assert req.status == ChargePointStatus.unavailable
@@ -1,9 +1,11 @@
 """Unit tests: meter_engine (build_meter_values_payload, update_evse_meter, start_metering_loop)."""
 import asyncio
 import math
+import re
 
 import pytest
 
+from simulator_core.charger import Charger
 from simulator_core.dc_voltage import get_pack_voltage_V
 from simulator_core.evse import EVSE, EvseState, AC_GRID_VOLTAGE_V, SQRT3
 from simulator_core.meter_engine import (
@@ -11,6 +13,7 @@ from simulator_core.meter_engine import (
     start_metering_loop,
     update_evse_meter,
 )
+from tests.unit._virtual_clock import VirtualClockPolicy
 
 pytestmark = pytest.mark.unit
 
@@ -18,6 +21,12 @@ DC_MEASURANDS = ["Energy.Active.Import.Register", "Power.Active.Import", "Curren
 AC_MEASURANDS = ["Energy.Active.Import.Register", "Power.Active.Import", "Current.Import"]
 
 
+@pytest.fixture(scope="module")
+def event_loop_policy():
+    """Run this module's async tests on a virtual clock, so metering-loop sleeps cost no wall time."""
+    return VirtualClockPolicy()
+
+
 def test_build_meter_values_payload():
     """build_meter_values_payload returns OCPP-shaped dict with connectorId, transactionId, meterValue."""
     evse = EVSE(evse_id=1, max_power_W=22000.0)
@@ -38,6 +47,16 @@ def test_build_meter_values_payload():
     assert "SoC" in values
 
 
+def test_build_meter_values_payload_timestamp_and_unknown_tokens():
+    """Timestamp is UTC with millisecond precision and a Z suffix; unknown measurand tokens are skipped."""
+    evse = EVSE(evse_id=1)
+    evse.transaction_id = 7
+    payload = build_meter_values_payload(evse, ["Power.Active.Import", "Not.A.Measurand"])
+    meter_value = payload["meterValue"][0]
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z", meter_value["timestamp"])
+    assert [s["measurand"] for s in meter_value["sampledValue"]] == ["Power.Active.Import"]
+
+
 def test_build_meter_values_payload_ac_phase_measurands():
     """AC phase measurands produce phase-tagged sampledValues with correct wire measurand names."""
     evse = EVSE(evse_id=1, max_power_W=22000.0, power_type="AC")
@@ -88,6 +107,21 @@ def test_update_evse_meter():
     assert evse.soc_pct >= 20.0
 
 
+def test_update_evse_meter_integrates_energy_and_caps_soc():
+    """Energy integrates power over dt; SoC follows session energy / capacity and is capped at 100%."""
+    evse = EVSE(evse_id=1, power_type="AC")
+    evse.state = EvseState.Charging
+    evse.transaction_id = 1
+    evse.start_soc_pct = 20.0
+    evse.battery_capacity_Wh = 100_000.0
+    update_evse_meter(evse, dt_s=3600.0, limit_W_override=11000.0)
+    assert evse.energy_Wh == 11000.0
+    assert evse.soc_pct == pytest.approx(31.0)
+    evse.start_soc_pct = 95.0
+    update_evse_meter(evse, dt_s=3600.0, limit_W_override=11000.0)
+    assert evse.soc_pct == 100.0
+
+
 def test_update_evse_meter_voltage_from_soc():
     """Voltage is computed from SOC using the sigmoid OCV model."""
     evse = EVSE(evse_id=1)
@@ -102,6 +136,8 @@ def test_update_evse_meter_voltage_from_soc():
     assert evse.power_W == 11000.0
 
 
+@pytest.mark.serial
+@pytest.mark.xdist_group("serial")
 @pytest.mark.asyncio
 async def test_start_metering_loop_sends_once_then_stops():
     """start_metering_loop runs until stop_event; callback receives payload."""
@@ -110,12 +146,14 @@ async def test_start_metering_loop_sends_once_then_stops():
     evse.transaction_id = 1
     evse.offered_limit_W = 11000.0
     received = []
+    first = asyncio.Event()
 
     async def send_cb(payload):
         received.append(payload)
+        first.set()
 
     task, stop_event = start_metering_loop(evse, send_cb, interval_s=0.05, measurands=DC_MEASURANDS)
-    await asyncio.sleep(0.06)
+    await asyncio.wait_for(first.wait(), timeout=1.0)
     stop_event.set()
     await asyncio.wait_for(task, timeout=1.0)
     assert len(received) >= 1
@@ -192,41 +230,57 @@ def test_update_evse_meter_dc_voltage_varies_with_soc():
     assert voltage_high > voltage_low  # Higher SoC = higher voltage
 
 
-def test_get_effective_power_w_zero_when_suspended_ev():
+def test_get_voltage_V_cache_tracks_soc(dc_evse):
+    """DC voltage is reused while SoC is unchanged and recomputed as soon as it moves."""
+    for soc in (20.0, 20.0, 20.004, 65.5, 20.0):
+        dc_evse.soc_pct = soc
+        assert dc_evse.get_voltage_V() == get_pack_voltage_V(soc)
+
+
+def test_meter_tick_voltage_reused_by_snapshot(dc_evse, monkeypatch):
+    """The DC pack voltage computed by a metering tick is reused by get_meter_snapshot at the same SoC."""
+    dc_evse.state = EvseState.Charging
+    dc_evse.transaction_id = 1
+    update_evse_meter(dc_evse, dt_s=60.0, limit_W_override=50000.0)
+    tick_voltage = dc_evse.get_voltage_V()
+    monkeypatch.setattr("simulator_core.evse.get_pack_voltage_V", lambda *a: pytest.fail("voltage recomputed"))
+    assert dc_evse.get_meter_snapshot()["voltage_V"] == tick_voltage
+    assert dc_evse.current_A == pytest.approx(50000.0 / tick_voltage)
+
+
+def test_get_effective_power_w_zero_when_suspended_ev(dc_evse):
     """get_effective_power_W returns 0 when state is SuspendedEV even if offered_limit_W > 0."""
-    evse = EVSE(evse_id=1)
-    evse.state = EvseState.SuspendedEV
-    evse.offered_limit_W = 11000.0
-    assert evse.get_effective_power_W() == 0.0
+    dc_evse.state = EvseState.SuspendedEV
+    dc_evse.offered_limit_W = 11000.0
+    assert dc_evse.get_effective_power_W() == 0.0
 
 
-def test_get_effective_power_w_zero_when_suspended_evse():
+def test_get_effective_power_w_zero_when_suspended_evse(dc_evse):
     """get_effective_power_W returns 0 when state is SuspendedEVSE even if offered_limit_W > 0."""
-    evse = EVSE(evse_id=1)
-    evse.state = EvseState.SuspendedEVSE
-    evse.offered_limit_W = 11000.0
-    assert evse.get_effective_power_W() == 0.0
+    dc_evse.state = EvseState.SuspendedEVSE
+    dc_evse.offered_limit_W = 11000.0
+    assert dc_evse.get_effective_power_W() == 0.0
 
 
-def test_get_effective_power_w_returns_override_when_charging():
+def test_get_effective_power_w_returns_override_when_charging(dc_evse):
     """get_effective_power_W returns limit_W_override when state is Charging."""
-    evse = EVSE(evse_id=1)
-    evse.state = EvseState.Charging
-    assert evse.get_effective_power_W(limit_W_override=11000.0) == 11000.0
+    dc_evse.state = EvseState.Charging
+    assert dc_evse.get_effective_power_W(limit_W_override=11000.0) == 11000.0
 
 
-def test_evse_ac_power_conversion():
+def test_evse_ac_power_conversion(ac_evse_shared):
     """Test AC power/current conversion methods on EVSE."""
-    evse = EVSE(evse_id=1, power_type="AC")
     # 32A * sqrt(3) * 400V ≈ 22.17 kW
-    power = evse.ac_current_to_power_W(32.0)
+    power = ac_evse_shared.ac_current_to_power_W(32.0)
     assert abs(power - 32.0 * SQRT3 * AC_GRID_VOLTAGE_V) < 0.01
     # Reverse: 22000W -> ~31.75A
-    current = evse.ac_power_to_current_A(22000.0)
+    current = ac_evse_shared.ac_power_to_current_A(22000.0)
     expected = 22000.0 / (SQRT3 * AC_GRID_VOLTAGE_V)
     assert abs(current - expected) < 0.01
 
 
+@pytest.mark.serial
+@pytest.mark.xdist_group("serial")
 @pytest.mark.asyncio
 async def test_start_metering_loop_ac_excludes_soc():
     """AC metering loop should produce payloads without SoC."""
@@ -235,12 +289,14 @@ async def test_start_metering_loop_ac_excludes_soc():
     evse.transaction_id = 1
     evse.offered_limit_W = 11000.0
     received = []
+    first = asyncio.Event()
 
     async def send_cb(payload):
         received.append(payload)
+        first.set()
 
     task, stop_event = start_metering_loop(evse, send_cb, interval_s=0.05, measurands=AC_MEASURANDS)
-    await asyncio.sleep(0.06)
+    await asyncio.wait_for(first.wait(), timeout=1.0)
     stop_event.set()
     await asyncio.wait_for(task, timeout=1.0)
     assert len(received) >= 1
@@ -249,6 +305,17 @@ async def test_start_metering_loop_ac_excludes_soc():
     assert "SoC" not in measurand_names
 
 
+async def _next_tick(_interval_s):
+    """Inter-tick wait for start_metering_loop(_sleep=...): yield once, so each loop turn is one tick."""
+    await asyncio.sleep(0)
+
+
+async def _drive_ticks(n):
+    """Give the metering task n event-loop turns (one tick each with _sleep=_next_tick)."""
+    for _ in range(n):
+        await asyncio.sleep(0)
+
+
 def _power_from_payload(payload):
     """Extract Power.Active.Import value (string) from meter payload."""
     for s in payload["meterValue"][0]["sampledValue"]:
@@ -257,6 +324,8 @@ def _power_from_payload(payload):
     return None
 
 
+@pytest.mark.serial
+@pytest.mark.xdist_group("serial")
 @pytest.mark.asyncio
 async def test_start_metering_loop_calls_on_soc_full_once_and_continues_with_zero_power():
     """When SoC reaches 100%, on_soc_full is called once; loop continues and later payloads have 0 power."""
@@ -279,9 +348,9 @@ async def test_start_metering_loop_calls_on_soc_full_once_and_continues_with_zer
 
     task, stop_event = start_metering_loop(
         evse, send_cb, interval_s=1.0, measurands=DC_MEASURANDS, on_soc_full=on_soc_full,
-        limit_fn=lambda: 40000.0,
+        limit_fn=lambda: 40000.0, _sleep=_next_tick,
     )
-    await asyncio.sleep(3.5)  # allow a few ticks: first hits 100% and calls on_soc_full, then more with 0 power
+    await _drive_ticks(3)  # first tick hits 100% and calls on_soc_full, the rest report 0 power
     stop_event.set()
     await asyncio.wait_for(task, timeout=2.0)
     assert len(on_soc_full_called) == 1
@@ -292,6 +361,8 @@ async def test_start_metering_loop_calls_on_soc_full_once_and_continues_with_zer
     assert all(p == "0" for p in later_powers)
 
 
+@pytest.mark.serial
+@pytest.mark.xdist_group("serial")
 @pytest.mark.asyncio
 async def test_start_metering_loop_without_on_soc_full_continues_at_100_soc():
     """Without on_soc_full, loop keeps running at 100% SoC and does not transition state."""
@@ -309,8 +380,9 @@ async def test_start_metering_loop_without_on_soc_full_continues_at_100_soc():
 
     task, stop_event = start_metering_loop(
         evse, send_cb, interval_s=1.0, measurands=DC_MEASURANDS, limit_fn=lambda: 40000.0,
+        _sleep=_next_tick,
     )
-    await asyncio.sleep(2.5)
+    await _drive_ticks(2)
     stop_event.set()
     await asyncio.wait_for(task, timeout=2.0)
     assert evse.state == EvseState.Charging
@@ -321,3 +393,35 @@ async def test_start_metering_loop_without_on_soc_full_continues_at_100_soc():
             if s.get("measurand") == "SoC":
                 assert s["value"] in ("100", "100.0")
                 break
+
+
+@pytest.mark.serial
+@pytest.mark.xdist_group("serial")
+@pytest.mark.asyncio
+async def test_start_metering_loop_four_evse_charger_meters_independently():
+    """Concurrent loops on a 4-EVSE charger each meter their own EVSE at their own limit."""
+    limits_W = {1: 7400.0, 2: 11000.0, 3: 22000.0, 4: 50000.0}
+    charger = Charger("CP-MULTI", evses=[EVSE(evse_id=i) for i in limits_W])
+    received: dict[int, list] = {i: [] for i in limits_W}
+    loops = []
+    for evse in charger.evses:
+        evse.state = EvseState.Charging
+        evse.transaction_id = evse.evse_id
+
+        async def send_cb(payload, _received=received[evse.evse_id]):
+            _received.append(payload)
+
+        loops.append(start_metering_loop(
+            evse, send_cb, interval_s=3600.0, measurands=DC_MEASURANDS,
+            limit_fn=lambda _limit=limits_W[evse.evse_id]: _limit, _sleep=_next_tick,
+        ))
+    await _drive_ticks(3)
+    for task, stop_event in loops:
+        stop_event.set()
+    await asyncio.wait_for(asyncio.gather(*(task for task, _ in loops)), timeout=1.0)
+    for evse in charger.evses:
+        ticks = received[evse.evse_id]
+        assert ticks and all(p["connectorId"] == evse.evse_id for p in ticks)
+        # interval_s of one hour: each tick adds exactly limit_W Wh
+        assert evse.energy_Wh == pytest.approx(limits_W[evse.evse_id] * len(ticks))
+        assert evse.power_W == limits_W[evse.evse_id]
@@ -1,5 +1,6 @@
 """Tests for OCPP Authorize workflow: OCPPAuthorizationEnabled True/False and start_transaction flow."""
 import asyncio
+import collections
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -33,32 +34,27 @@ def _start_resp(transaction_id: int = 1, accepted: bool = True):
     )
 
 
+# CSMS responses, preallocated once; the payload dataclasses are only read by the client.
+_STATUS_OK = call_result.StatusNotificationPayload()
+_AUTH_ACCEPT = _auth_resp(accepted=True)
+_AUTH_REJECT = _auth_resp(accepted=False)
+_START_REJECT = _start_resp(transaction_id=0, accepted=False)
+
+# Charger config prototypes, built once; Charger copies the dict, so tests never mutate these.
+_AUTH_ENABLED_CONFIG = {"HeartbeatInterval": 120, "MeterValuesSampleInterval": 30, "OCPPAuthorizationEnabled": True}
+_AUTH_DISABLED_CONFIG = {**_AUTH_ENABLED_CONFIG, "OCPPAuthorizationEnabled": False}
+
+
 @pytest.fixture
 def charger_auth_enabled():
     """Charger with OCPPAuthorizationEnabled True."""
-    return Charger(
-        charge_point_id="CP_AUTH",
-        evses=[EVSE(evse_id=1, max_power_W=22000.0)],
-        config={
-            "HeartbeatInterval": 120,
-            "MeterValuesSampleInterval": 30,
-            "OCPPAuthorizationEnabled": True,
-        },
-    )
+    return Charger(charge_point_id="CP_AUTH", evses=[EVSE(evse_id=1, max_power_W=22000.0)], config=_AUTH_ENABLED_CONFIG)
 
 
 @pytest.fixture
 def charger_auth_disabled():
     """Charger with OCPPAuthorizationEnabled False (FreeVend)."""
-    return Charger(
-        charge_point_id="CP_FREE",
-        evses=[EVSE(evse_id=1, max_power_W=22000.0)],
-        config={
-            "HeartbeatInterval": 120,
-            "MeterValuesSampleInterval": 30,
-            "OCPPAuthorizationEnabled": False,
-        },
-    )
+    return Charger(charge_point_id="CP_FREE", evses=[EVSE(evse_id=1, max_power_W=22000.0)], config=_AUTH_DISABLED_CONFIG)
 
 
 @pytest.fixture
@@ -75,6 +71,17 @@ def charge_point_auth_disabled(mock_connection, charger_auth_disabled):
     return cp
 
 
+def _install_call_queue(cp, responses):
+    """Replace cp.call with a plain coroutine that pops the next preallocated response; returns the queue."""
+    queue = collections.deque(responses)
+
+    async def _call(req):
+        return queue.popleft()
+
+    cp.call = _call
+    return queue
+
+
 async def _dummy_meter_task():
     await asyncio.sleep(999)
 
@@ -83,21 +90,15 @@ async def _dummy_meter_task():
 async def test_authorize_enabled_then_start_accepted(charge_point_auth_enabled):
     """When OCPPAuthorizationEnabled True: Authorize then StartTransaction; both Accepted -> charging starts."""
     # StatusNotification (Preparing), Authorize, StartTransaction, StatusNotification (Charging)
-    status_resp = call_result.StatusNotificationPayload()
     responses = [
-        status_resp,
-        _auth_resp(accepted=True),
+        _STATUS_OK,
+        _AUTH_ACCEPT,
         _start_resp(transaction_id=42, accepted=True),
-        status_resp,
+        _STATUS_OK,
     ]
-    call_responses = iter(responses)
-
-    async def mock_call(req):
-        return next(call_responses)
+    queue = _install_call_queue(charge_point_auth_enabled, responses)
 
-    with patch.object(charge_point_auth_enabled, "call", side_effect=mock_call), patch(
-        "simulator_core.ocpp_client.start_metering_loop"
-    ) as mock_meter:
+    with patch("simulator_core.ocpp_client.start_metering_loop") as mock_meter:
         meter_task = asyncio.create_task(_dummy_meter_task())
         mock_meter.return_value = (meter_task, asyncio.Event())
         try:
@@ -109,6 +110,7 @@ async def test_authorize_enabled_then_start_accepted(charge_point_auth_enabled):
             except asyncio.CancelledError:
                 pass
 
+    assert not queue
     assert result == 42
     evse = charge_point_auth_enabled._charger.get_evse(1)
     assert evse.transaction_id == 42
@@ -119,22 +121,17 @@ async def test_authorize_enabled_then_start_accepted(charge_point_auth_enabled):
 @pytest.mark.asyncio
 async def test_authorize_enabled_authorize_invalid_then_available(charge_point_auth_enabled):
     """When OCPPAuthorizationEnabled True and Authorize returns Invalid: no StartTransaction, EVSE back to Available."""
-    status_resp = call_result.StatusNotificationPayload()
     responses = [
-        status_resp,
-        _auth_resp(accepted=False),
-        status_resp,
+        _STATUS_OK,
+        _AUTH_REJECT,
+        _STATUS_OK,
     ]
-    call_responses = iter(responses)
+    queue = _install_call_queue(charge_point_auth_enabled, responses)
 
-    async def mock_call(req):
-        return next(call_responses)
-
-    with patch.object(charge_point_auth_enabled, "call", side_effect=mock_call), patch(
-        "simulator_core.ocpp_client.start_metering_loop"
-    ) as mock_meter:
+    with patch("simulator_core.ocpp_client.start_metering_loop") as mock_meter:
         result = await charge_point_auth_enabled.start_transaction(connector_id=1, id_tag="TAG1")
 
+    assert not queue
     assert result is None
     evse = charge_point_auth_enabled._charger.get_evse(1)
     assert evse.transaction_id is None
@@ -145,20 +142,14 @@ async def test_authorize_enabled_authorize_invalid_then_available(charge_point_a
 @pytest.mark.asyncio
 async def test_authorize_disabled_free_vend_start_accepted(charge_point_auth_disabled):
     """When OCPPAuthorizationEnabled False: no Authorize; StartTransaction only; Accepted -> charging starts."""
-    status_resp = call_result.StatusNotificationPayload()
     responses = [
-        status_resp,
+        _STATUS_OK,
         _start_resp(transaction_id=7, accepted=True),
-        status_resp,
+        _STATUS_OK,
     ]
-    call_responses = iter(responses)
-
-    async def mock_call(req):
-        return next(call_responses)
+    queue = _install_call_queue(charge_point_auth_disabled, responses)
 
-    with patch.object(charge_point_auth_disabled, "call", side_effect=mock_call), patch(
-        "simulator_core.ocpp_client.start_metering_loop"
-    ) as mock_meter:
+    with patch("simulator_core.ocpp_client.start_metering_loop") as mock_meter:
         meter_task = asyncio.create_task(_dummy_meter_task())
         mock_meter.return_value = (meter_task, asyncio.Event())
         try:
@@ -170,6 +161,7 @@ async def test_authorize_disabled_free_vend_start_accepted(charge_point_auth_dis
             except asyncio.CancelledError:
                 pass
 
+    assert not queue
     assert result == 7
     evse = charge_point_auth_disabled._charger.get_evse(1)
     assert evse.transaction_id == 7
@@ -180,22 +172,17 @@ async def test_authorize_disabled_free_vend_start_accepted(charge_point_auth_dis
 @pytest.mark.asyncio
 async def test_authorize_disabled_start_invalid_reverts_to_available(charge_point_auth_disabled):
     """When OCPPAuthorizationEnabled False and StartTransaction returns Invalid: EVSE reverts to Available."""
-    status_resp = call_result.StatusNotificationPayload()
     responses = [
-        status_resp,
-        _start_resp(transaction_id=0, accepted=False),
-        status_resp,
+        _STATUS_OK,
+        _START_REJECT,
+        _STATUS_OK,
     ]
-    call_responses = iter(responses)
+    queue = _install_call_queue(charge_point_auth_disabled, responses)
 
-    async def mock_call(req):
-        return next(call_responses)
-
-    with patch.object(charge_point_auth_disabled, "call", side_effect=mock_call), patch(
-        "simulator_core.ocpp_client.start_metering_loop"
-    ) as mock_meter:
+    with patch("simulator_core.ocpp_client.start_metering_loop") as mock_meter:
         result = await charge_point_auth_disabled.start_transaction(connector_id=1, id_tag="TAG1")
 
+    assert not queue
     assert result is None
     evse = charge_point_auth_disabled._charger.get_evse(1)
     assert evse.transaction_id is None
@@ -209,35 +196,25 @@ async def test_soc_full_transitions_to_suspended_ev_and_meter_values_continue(mo
     charger = Charger(
         charge_point_id="CP_SOC",
         evses=[EVSE(evse_id=1, max_power_W=22000.0)],
-        config={
-            "HeartbeatInterval": 120,
-            "MeterValuesSampleInterval": 30,
-            "OCPPAuthorizationEnabled": False,
-        },
+        config=_AUTH_DISABLED_CONFIG,
     )
     cp = SimulatorChargePoint("CP_SOC", mock_connection)
     cp.set_charger(charger)
 
-    status_resp = call_result.StatusNotificationPayload()
     responses = [
-        status_resp,
+        _STATUS_OK,
         _start_resp(transaction_id=313, accepted=True),
-        status_resp,
+        _STATUS_OK,
     ]
-    call_responses = iter(responses)
+    _install_call_queue(cp, responses)
     captured_on_soc_full = []
 
-    async def mock_call(req):
-        return next(call_responses)
-
     def capture_metering_loop(evse, send_cb, measurands, interval_s, **kwargs):
         captured_on_soc_full.append(kwargs.get("on_soc_full"))
         meter_task = asyncio.create_task(_dummy_meter_task())
         return (meter_task, asyncio.Event())
 
-    with patch.object(cp, "call", side_effect=mock_call), patch(
-        "simulator_core.ocpp_client.start_metering_loop", side_effect=capture_metering_loop
-    ):
+    with patch("simulator_core.ocpp_client.start_metering_loop", side_effect=capture_metering_loop):
         result = await cp.start_transaction(
             connector_id=1,
             id_tag="TAG1",
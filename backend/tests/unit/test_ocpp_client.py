@@ -1,7 +1,7 @@
 """Unit tests for ocpp_client helpers and build_connection_url."""
-import json
-
+import orjson
 import pytest
+from ocpp.v16.enums import Phase, UnitOfMeasure
 
 from simulator_core.ocpp_client import (
     _connection_is_open,
@@ -12,28 +12,30 @@ from simulator_core.ocpp_client import (
     build_connection_url,
 )
 
+# Raw OCPP frames, serialized once.
+_BOOT_CALL = orjson.dumps([2, "unique-id", "BootNotification", {}])
+_CALL_RESULT = orjson.dumps([3, "unique-id", {}])
+_CALL_ERROR = orjson.dumps([4, "unique-id", "ErrorCode", "Description", {}])
+_SHORT_CALL = orjson.dumps([2, "unique-id"])
+_UNKNOWN_TYPE = orjson.dumps([99, "x"])
+
 
 @pytest.mark.unit
 class TestParseOcppMessageType:
     def test_call_returns_action_name(self):
-        raw = json.dumps([2, "unique-id", "BootNotification", {}])
-        assert _parse_ocpp_message_type(raw) == "BootNotification"
+        assert _parse_ocpp_message_type(_BOOT_CALL) == "BootNotification"
 
     def test_call_result(self):
-        raw = json.dumps([3, "unique-id", {}])
-        assert _parse_ocpp_message_type(raw) == "CallResult"
+        assert _parse_ocpp_message_type(_CALL_RESULT) == "CallResult"
 
     def test_call_error(self):
-        raw = json.dumps([4, "unique-id", "ErrorCode", "Description", {}])
-        assert _parse_ocpp_message_type(raw) == "CallError"
+        assert _parse_ocpp_message_type(_CALL_ERROR) == "CallError"
 
     def test_call_too_short_returns_unknown(self):
-        raw = json.dumps([2, "unique-id"])
-        assert _parse_ocpp_message_type(raw) == "Unknown"
+        assert _parse_ocpp_message_type(_SHORT_CALL) == "Unknown"
 
     def test_unknown_type_id(self):
-        raw = json.dumps([99, "x"])
-        assert _parse_ocpp_message_type(raw) == "Unknown"
+        assert _parse_ocpp_message_type(_UNKNOWN_TYPE) == "Unknown"
 
     def test_not_list_returns_unknown(self):
         assert _parse_ocpp_message_type('{"a":1}') == "Unknown"
@@ -41,6 +43,21 @@ class TestParseOcppMessageType:
     def test_invalid_json_returns_unknown(self):
         assert _parse_ocpp_message_type("not json") == "Unknown"
 
+    def test_str_frame_with_whitespace(self):
+        assert _parse_ocpp_message_type(' [ 2 , "id" , "Heartbeat" , {} ]') == "Heartbeat"
+
+    def test_escaped_action_falls_back_to_full_parse(self):
+        assert _parse_ocpp_message_type('[2, "id", "Boot\\u004eotification", {}]') == "BootNotification"
+
+    def test_truncated_call_returns_unknown(self):
+        assert _parse_ocpp_message_type('[2, "id", "Heartbeat", {}') == "Unknown"
+
+    def test_bytes_frame_not_utf8_returns_unknown(self):
+        assert _parse_ocpp_message_type(b'[2,"id","\xff",{}]') == "Unknown"
+
+    def test_non_json_whitespace_falls_back_to_full_parse(self):
+        assert _parse_ocpp_message_type('\xa0[3,"id",{]') == "Unknown"
+
 
 @pytest.mark.unit
 class TestConnectionIsOpen:
@@ -137,6 +154,25 @@ class TestDictToMeterValuesPayload:
         payload = _dict_to_meter_values_payload(d)
         assert payload.meter_value[0].sampled_value[0].location == "EV"
 
+    def test_repeated_shape_gets_fresh_values_and_phase(self):
+        """Payloads sharing a sampled-value shape reuse the cached template but carry their own value."""
+        def _payload(value):
+            return {
+                "connectorId": 1,
+                "meterValue": [
+                    {
+                        "timestamp": "2025-01-01T12:00:00.000Z",
+                        "sampledValue": [{"value": value, "measurand": "Current.Import", "phase": "L1", "unit": "A"}],
+                    }
+                ],
+            }
+
+        first = _dict_to_meter_values_payload(_payload("16.0")).meter_value[0].sampled_value[0]
+        second = _dict_to_meter_values_payload(_payload("32.0")).meter_value[0].sampled_value[0]
+        assert (first.value, second.value) == ("16.0", "32.0")
+        assert first is not second
+        assert second.phase == Phase.l1 and second.unit == UnitOfMeasure.a
+
 
 @pytest.mark.unit
 class TestBuildConnectionUrl:
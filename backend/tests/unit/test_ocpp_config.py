@@ -17,22 +17,22 @@ def mock_connection():
     return AsyncMock()
 
 
+# Known config keys, built once; Charger copies the dict, so tests never mutate this one.
+_KNOWN_CONFIG = {
+    "HeartbeatInterval": 120,
+    "ConnectionTimeOut": 60,
+    "MeterValuesSampleInterval": 30,
+    "ClockAlignedDataInterval": 900,
+    "AuthorizeRemoteTxRequests": True,
+    "LocalAuthListEnabled": True,
+    "OCPPAuthorizationEnabled": True,
+}
+
+
 @pytest.fixture
 def charger_with_config():
     """Charger with known config keys."""
-    return Charger(
-        charge_point_id="CP_TEST",
-        evses=[EVSE(evse_id=1, max_power_W=22000.0)],
-        config={
-            "HeartbeatInterval": 120,
-            "ConnectionTimeOut": 60,
-            "MeterValuesSampleInterval": 30,
-            "ClockAlignedDataInterval": 900,
-            "AuthorizeRemoteTxRequests": True,
-            "LocalAuthListEnabled": True,
-            "OCPPAuthorizationEnabled": True,
-        },
-    )
+    return Charger(charge_point_id="CP_TEST", evses=[EVSE(evse_id=1, max_power_W=22000.0)], config=_KNOWN_CONFIG)
 
 
 @pytest.fixture
@@ -1,12 +1,16 @@
 """Unit tests for simulator_core.scenario_engine."""
 from __future__ import annotations
 
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from simulator_core import store
 from simulator_core.evse import EvseState
+from simulator_core.ocpp_client import connect_charge_point
 from simulator_core.scenario_engine import (
     ScenarioRun,
     clear_all,
@@ -21,24 +25,41 @@ from simulator_core.scenario_engine import (
 # Helpers to build fake chargers / EVSEs / vehicles
 # ---------------------------------------------------------------------------
 
-def _make_evse(evse_id: int, state: EvseState = EvseState.Available) -> MagicMock:
-    evse = MagicMock()
-    evse.evse_id = evse_id
-    evse.state = state
-    evse.transaction_id = None
-    return evse
+@dataclass(slots=True)
+class _FakeEvse:
+    """EVSE stand-in with just the attributes run_rush_period reads."""
 
+    evse_id: int
+    state: EvseState = EvseState.Available
+    transaction_id: int | None = None
 
-def _make_sim(charge_point_id: str, location_id: str, evses, *, connected: bool = True) -> MagicMock:
-    sim = MagicMock()
-    sim.charge_point_id = charge_point_id
-    sim.location_id = location_id
-    sim.evses = evses
-    sim.is_connected = connected
-    sim._ocpp_client = AsyncMock()
-    sim._ocpp_client.start_transaction = AsyncMock(return_value=1)
-    sim.clear_stop_connect = MagicMock()
-    return sim
+
+async def _no_sleep(secs: float) -> None:
+    """sleep_fn that returns immediately (shared; tests that inspect sleeps pass their own)."""
+
+
+async def _accept_transaction(connector_id, id_tag, **kwargs) -> int:
+    return 1
+
+
+async def _reject_transaction(connector_id, id_tag, **kwargs) -> int:
+    raise RuntimeError("CSMS rejected")
+
+
+class _FakeSim:
+    """Simulator charger stand-in; _ocpp_client.start_transaction accepts by default (tests may replace it)."""
+
+    __slots__ = ("charge_point_id", "location_id", "evses", "is_connected", "_ocpp_client")
+
+    def __init__(self, charge_point_id: str, location_id: str, evses, *, connected: bool = True) -> None:
+        self.charge_point_id = charge_point_id
+        self.location_id = location_id
+        self.evses = evses
+        self.is_connected = connected
+        self._ocpp_client = SimpleNamespace(start_transaction=_accept_transaction)
+
+    def clear_stop_connect(self) -> None:
+        pass
 
 
 def _make_row(charge_point_id: str, connection_url: str = "ws://csms/ocpp") -> SimpleNamespace:
@@ -60,10 +81,25 @@ def _make_vehicle(id_tag: str, battery_kwh: float = 75.0) -> SimpleNamespace:
 # In-memory store helpers
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="module")
+def _store_patch():
+    """Patch the scenario engine's charger store once per module with a MagicMock specced on the store module."""
+    mock = MagicMock(spec=store)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("simulator_core.scenario_engine.store", mock)
+        yield mock
+
+
+@pytest.fixture
+def mock_store(_store_patch):
+    """The module's patched store, reset per test; set ``mock_store.get_all.return_value`` to the sims under test."""
+    _store_patch.reset_mock(return_value=True, side_effect=True)
+    return _store_patch
+
+
 @pytest.fixture(autouse=True)
 def reset_scenario_store():
-    """Clear the scenario store before and after each test."""
-    clear_all()
+    """Clear the scenario store after each test."""
     yield
     clear_all()
 
@@ -72,107 +108,47 @@ def reset_scenario_store():
 # Tests: pairing logic
 # ---------------------------------------------------------------------------
 
-@pytest.mark.unit
-class TestRushPeriodPairing:
-    async def test_all_evses_and_vehicles_available(self):
-        """All 3 EVSEs paired with 3 vehicles → 3 completed pairs."""
-        evses = [_make_evse(1), _make_evse(2), _make_evse(3)]
-        sim = _make_sim("CP-1", "loc-1", evses)
-        vehicles = [_make_vehicle("tag-1"), _make_vehicle("tag-2"), _make_vehicle("tag-3")]
-        charger_rows = [_make_row("CP-1")]
-
-        no_sleep = AsyncMock()
-
-        with patch("simulator_core.scenario_engine.store") as mock_store:
-            mock_store.get_all.return_value = [sim]
-            run = await run_rush_period("loc-1", 3, charger_rows, vehicles, sleep_fn=no_sleep)
-
-        assert run.status == "completed"
-        assert run.total_pairs == 3
-        assert run.completed_pairs == 3
-        assert run.failed_pairs == 0
-
-    async def test_limited_by_vehicles(self):
-        """5 EVSEs but only 2 vehicles → 2 pairs."""
-        evses = [_make_evse(i) for i in range(1, 6)]
-        sim = _make_sim("CP-1", "loc-1", evses)
-        vehicles = [_make_vehicle("tag-1"), _make_vehicle("tag-2")]
-        charger_rows = [_make_row("CP-1")]
+def _setup_rush(n_evses: int, vehicle_tags: list[str | None], *, evse_state: EvseState = EvseState.Available,
+                connected: bool = True):
+    """One "CP-1" charger in "loc-1" with n_evses EVSEs; a None tag builds a vehicle without id_tags.
 
-        no_sleep = AsyncMock()
+    Returns (sim, vehicles, charger_rows).
+    """
+    sim = _FakeSim("CP-1", "loc-1", [_FakeEvse(i, evse_state) for i in range(1, n_evses + 1)], connected=connected)
+    vehicles = [
+        _make_vehicle(tag) if tag is not None else SimpleNamespace(id_tags=[], battery_capacity_kwh=50.0)
+        for tag in vehicle_tags
+    ]
+    return sim, vehicles, [_make_row("CP-1")]
 
-        with patch("simulator_core.scenario_engine.store") as mock_store:
-            mock_store.get_all.return_value = [sim]
-            run = await run_rush_period("loc-1", 2, charger_rows, vehicles, sleep_fn=no_sleep)
-
-        assert run.total_pairs == 2
-        assert run.completed_pairs == 2
-
-    async def test_limited_by_evses(self):
-        """2 EVSEs but 5 vehicles → 2 pairs."""
-        evses = [_make_evse(1), _make_evse(2)]
-        sim = _make_sim("CP-1", "loc-1", evses)
-        vehicles = [_make_vehicle(f"tag-{i}") for i in range(1, 6)]
-        charger_rows = [_make_row("CP-1")]
 
-        no_sleep = AsyncMock()
-
-        with patch("simulator_core.scenario_engine.store") as mock_store:
-            mock_store.get_all.return_value = [sim]
-            run = await run_rush_period("loc-1", 2, charger_rows, vehicles, sleep_fn=no_sleep)
-
-        assert run.total_pairs == 2
-        assert run.completed_pairs == 2
-
-    async def test_no_vehicles_completes_immediately(self):
-        """No vehicles → scenario completes with 0 pairs."""
-        evses = [_make_evse(1)]
-        sim = _make_sim("CP-1", "loc-1", evses)
-        charger_rows = [_make_row("CP-1")]
-
-        no_sleep = AsyncMock()
-
-        with patch("simulator_core.scenario_engine.store") as mock_store:
-            mock_store.get_all.return_value = [sim]
-            run = await run_rush_period("loc-1", 5, charger_rows, [], sleep_fn=no_sleep)
-
-        assert run.status == "completed"
-        assert run.total_pairs == 0
-
-    async def test_no_available_evses_completes_immediately(self):
-        """All EVSEs are busy → scenario completes with 0 pairs."""
-        busy_evse = _make_evse(1, state=EvseState.Charging)
-        sim = _make_sim("CP-1", "loc-1", [busy_evse])
-        vehicles = [_make_vehicle("tag-1")]
-        charger_rows = [_make_row("CP-1")]
-
-        no_sleep = AsyncMock()
+@pytest.mark.unit
+class TestRushPeriodPairing:
+    @pytest.mark.parametrize(
+        "n_evses,evse_state,vehicle_tags,duration,total,completed",
+        [
+            # All 3 EVSEs paired with 3 vehicles → 3 completed pairs.
+            pytest.param(3, EvseState.Available, ["tag-1", "tag-2", "tag-3"], 3, 3, 3, id="all-available"),
+            pytest.param(5, EvseState.Available, ["tag-1", "tag-2"], 2, 2, 2, id="limited-by-vehicles"),
+            pytest.param(2, EvseState.Available, [f"tag-{i}" for i in range(1, 6)], 2, 2, 2, id="limited-by-evses"),
+            pytest.param(1, EvseState.Available, [], 5, 0, 0, id="no-vehicles"),
+            # All EVSEs busy → nothing to pair.
+            pytest.param(1, EvseState.Charging, ["tag-1"], 5, 0, 0, id="no-available-evses"),
+            # Vehicles with no id_tags are skipped.
+            pytest.param(2, EvseState.Available, ["tag-1", None], 2, 1, 1, id="vehicle-without-id-tags"),
+        ],
+    )
+    async def test_pairing(self, mock_store, n_evses, evse_state, vehicle_tags, duration, total, completed):
+        """Pairs = min(available EVSEs, tagged vehicles); the run always completes."""
+        sim, vehicles, charger_rows = _setup_rush(n_evses, vehicle_tags, evse_state=evse_state)
 
-        with patch("simulator_core.scenario_engine.store") as mock_store:
-            mock_store.get_all.return_value = [sim]
-            run = await run_rush_period("loc-1", 5, charger_rows, vehicles, sleep_fn=no_sleep)
+        mock_store.get_all.return_value = [sim]
+        run = await run_rush_period("loc-1", duration, charger_rows, vehicles, sleep_fn=_no_sleep)
 
         assert run.status == "completed"
-        assert run.total_pairs == 0
-
-    async def test_vehicles_without_id_tags_skipped(self):
-        """Vehicles with no id_tags are skipped."""
-        evses = [_make_evse(1), _make_evse(2)]
-        sim = _make_sim("CP-1", "loc-1", evses)
-        valid_v = _make_vehicle("tag-1")
-        no_tag_v = SimpleNamespace(id_tags=[], battery_capacity_kwh=50.0)
-        charger_rows = [_make_row("CP-1")]
-
-        no_sleep = AsyncMock()
-
-        with patch("simulator_core.scenario_engine.store") as mock_store:
-            mock_store.get_all.return_value = [sim]
-            run = await run_rush_period(
-                "loc-1", 2, charger_rows, [valid_v, no_tag_v], sleep_fn=no_sleep
-            )
-
-        assert run.total_pairs == 1
-        assert run.completed_pairs == 1
+        assert run.total_pairs == total
+        assert run.completed_pairs == completed
+        assert run.failed_pairs == 0
 
 
 # ---------------------------------------------------------------------------
@@ -181,61 +157,54 @@ class TestRushPeriodPairing:
 
 @pytest.mark.unit
 class TestRushPeriodConnection:
-    async def test_skips_charger_that_fails_to_connect(self):
+    async def test_skips_charger_that_fails_to_connect(self, mock_store):
         """Charger that stays disconnected is added to offline_charger_ids."""
-        evses = [_make_evse(1)]
-        sim = _make_sim("CP-1", "loc-1", evses, connected=False)
+        evses = [_FakeEvse(1)]
+        sim = _FakeSim("CP-1", "loc-1", evses, connected=False)
         # Even after sleep, still not connected
         sim.is_connected = False
         vehicles = [_make_vehicle("tag-1")]
         charger_rows = [_make_row("CP-1")]
 
-        fake_connect = AsyncMock()
-        no_sleep = AsyncMock()
+        fake_connect = AsyncMock(spec=connect_charge_point)
 
-        with patch("simulator_core.scenario_engine.store") as mock_store:
-            mock_store.get_all.return_value = [sim]
-            run = await run_rush_period(
-                "loc-1", 2, charger_rows, vehicles,
-                connect_fn=fake_connect, sleep_fn=no_sleep,
-            )
+        mock_store.get_all.return_value = [sim]
+        run = await run_rush_period(
+            "loc-1", 2, charger_rows, vehicles,
+            connect_fn=fake_connect, sleep_fn=_no_sleep,
+        )
 
         assert "CP-1" in run.offline_charger_ids
         assert run.total_pairs == 0
         assert run.status == "completed"
 
-    async def test_already_connected_charger_not_reconnected(self):
+    async def test_already_connected_charger_not_reconnected(self, mock_store):
         """Already-connected charger skips the connect step."""
-        evses = [_make_evse(1)]
-        sim = _make_sim("CP-1", "loc-1", evses, connected=True)
+        evses = [_FakeEvse(1)]
+        sim = _FakeSim("CP-1", "loc-1", evses, connected=True)
         vehicles = [_make_vehicle("tag-1")]
         charger_rows = [_make_row("CP-1")]
 
-        fake_connect = AsyncMock()
-        no_sleep = AsyncMock()
+        fake_connect = AsyncMock(spec=connect_charge_point)
 
-        with patch("simulator_core.scenario_engine.store") as mock_store:
-            mock_store.get_all.return_value = [sim]
-            await run_rush_period(
-                "loc-1", 1, charger_rows, vehicles,
-                connect_fn=fake_connect, sleep_fn=no_sleep,
-            )
+        mock_store.get_all.return_value = [sim]
+        await run_rush_period(
+            "loc-1", 1, charger_rows, vehicles,
+            connect_fn=fake_connect, sleep_fn=_no_sleep,
+        )
 
         # connect_fn should NOT have been called (sleep is called from start_transaction wait,
         # but connect_fn itself should not be called for already-connected chargers)
         fake_connect.assert_not_called()
 
-    async def test_charger_not_in_location_ignored(self):
+    async def test_charger_not_in_location_ignored(self, mock_store):
         """Charger in a different location is not touched."""
-        other_sim = _make_sim("CP-OTHER", "loc-99", [_make_evse(1)])
+        other_sim = _FakeSim("CP-OTHER", "loc-99", [_FakeEvse(1)])
         vehicles = [_make_vehicle("tag-1")]
         charger_rows = []  # no rows for loc-1
 
-        no_sleep = AsyncMock()
-
-        with patch("simulator_core.scenario_engine.store") as mock_store:
-            mock_store.get_all.return_value = [other_sim]
-            run = await run_rush_period("loc-1", 1, charger_rows, vehicles, sleep_fn=no_sleep)
+        mock_store.get_all.return_value = [other_sim]
+        run = await run_rush_period("loc-1", 1, charger_rows, vehicles, sleep_fn=_no_sleep)
 
         assert run.total_pairs == 0
 
@@ -246,10 +215,10 @@ class TestRushPeriodConnection:
 
 @pytest.mark.unit
 class TestRushPeriodTiming:
-    async def test_interval_between_plug_ins(self):
+    async def test_interval_between_plug_ins(self, mock_store):
         """For 3 pairs over 6 minutes, sleep should be called twice with 120 s interval."""
-        evses = [_make_evse(i) for i in range(1, 4)]
-        sim = _make_sim("CP-1", "loc-1", evses)
+        evses = [_FakeEvse(i) for i in range(1, 4)]
+        sim = _FakeSim("CP-1", "loc-1", evses)
         vehicles = [_make_vehicle(f"tag-{i}") for i in range(1, 4)]
         charger_rows = [_make_row("CP-1")]
 
@@ -258,9 +227,8 @@ class TestRushPeriodTiming:
         async def tracking_sleep(secs: float) -> None:
             sleep_calls.append(secs)
 
-        with patch("simulator_core.scenario_engine.store") as mock_store:
-            mock_store.get_all.return_value = [sim]
-            await run_rush_period("loc-1", 6, charger_rows, vehicles, sleep_fn=tracking_sleep)
+        mock_store.get_all.return_value = [sim]
+        await run_rush_period("loc-1", 6, charger_rows, vehicles, sleep_fn=tracking_sleep)
 
         # 3 pairs: sleep called 2 times (before 2nd and 3rd plug-in)
         assert len(sleep_calls) == 2
@@ -268,10 +236,10 @@ class TestRushPeriodTiming:
         for s in sleep_calls:
             assert abs(s - expected_interval) < 0.01
 
-    async def test_single_pair_no_sleep_between_plug_ins(self):
+    async def test_single_pair_no_sleep_between_plug_ins(self, mock_store):
         """With 1 pair, no inter-plug-in sleep is needed."""
-        evses = [_make_evse(1)]
-        sim = _make_sim("CP-1", "loc-1", evses)
+        evses = [_FakeEvse(1)]
+        sim = _FakeSim("CP-1", "loc-1", evses)
         vehicles = [_make_vehicle("tag-1")]
         charger_rows = [_make_row("CP-1")]
 
@@ -280,9 +248,8 @@ class TestRushPeriodTiming:
         async def tracking_sleep(secs: float) -> None:
             sleep_calls.append(secs)
 
-        with patch("simulator_core.scenario_engine.store") as mock_store:
-            mock_store.get_all.return_value = [sim]
-            await run_rush_period("loc-1", 5, charger_rows, vehicles, sleep_fn=tracking_sleep)
+        mock_store.get_all.return_value = [sim]
+        await run_rush_period("loc-1", 5, charger_rows, vehicles, sleep_fn=tracking_sleep)
 
         # Only the connection-wait sleep (5.0 s for disconnected charger) would count,
         # but our sim is already connected, so no sleeps at all.
@@ -295,19 +262,16 @@ class TestRushPeriodTiming:
 
 @pytest.mark.unit
 class TestRushPeriodErrors:
-    async def test_transaction_failure_increments_failed_pairs(self):
+    async def test_transaction_failure_increments_failed_pairs(self, mock_store):
         """If start_transaction raises, failed_pairs is incremented."""
-        evses = [_make_evse(1), _make_evse(2)]
-        sim = _make_sim("CP-1", "loc-1", evses)
-        sim._ocpp_client.start_transaction = AsyncMock(side_effect=RuntimeError("CSMS rejected"))
+        evses = [_FakeEvse(1), _FakeEvse(2)]
+        sim = _FakeSim("CP-1", "loc-1", evses)
+        sim._ocpp_client.start_transaction = _reject_transaction
         vehicles = [_make_vehicle("tag-1"), _make_vehicle("tag-2")]
         charger_rows = [_make_row("CP-1")]
 
-        no_sleep = AsyncMock()
-
-        with patch("simulator_core.scenario_engine.store") as mock_store:
-            mock_store.get_all.return_value = [sim]
-            run = await run_rush_period("loc-1", 2, charger_rows, vehicles, sleep_fn=no_sleep)
+        mock_store.get_all.return_value = [sim]
+        run = await run_rush_period("loc-1", 2, charger_rows, vehicles, sleep_fn=_no_sleep)
 
         assert run.status == "completed"
         assert run.failed_pairs == 2
@@ -320,10 +284,10 @@ class TestRushPeriodErrors:
 
 @pytest.mark.unit
 class TestRushPeriodCancellation:
-    async def test_cancellation_halts_further_plug_ins(self):
+    async def test_cancellation_halts_further_plug_ins(self, mock_store):
         """Setting status to 'cancelled' mid-loop stops further plug-ins."""
-        evses = [_make_evse(i) for i in range(1, 4)]
-        sim = _make_sim("CP-1", "loc-1", evses)
+        evses = [_FakeEvse(i) for i in range(1, 4)]
+        sim = _FakeSim("CP-1", "loc-1", evses)
         vehicles = [_make_vehicle(f"tag-{i}") for i in range(1, 4)]
         charger_rows = [_make_row("CP-1")]
 
@@ -340,12 +304,8 @@ class TestRushPeriodCancellation:
 
         sim._ocpp_client.start_transaction = cancel_after_first
 
-        async def fake_sleep(secs: float) -> None:
-            pass  # don't actually wait
-
-        with patch("simulator_core.scenario_engine.store") as mock_store:
-            mock_store.get_all.return_value = [sim]
-            run = await run_rush_period("loc-1", 3, charger_rows, vehicles, sleep_fn=fake_sleep)
+        mock_store.get_all.return_value = [sim]
+        run = await run_rush_period("loc-1", 3, charger_rows, vehicles, sleep_fn=_no_sleep)
 
         # Only the first plug-in should have completed before cancellation
         assert plug_in_count == 1
@@ -356,9 +316,9 @@ class TestRushPeriodCancellation:
 # ---------------------------------------------------------------------------
 
 @pytest.mark.unit
+@pytest.mark.xdist_group("scenario_store")
 class TestScenarioStore:
     def test_set_and_get(self):
-        from datetime import datetime, timezone
         run = ScenarioRun(
             location_id="loc-x",
             scenario_type="rush_period",
@@ -370,7 +330,6 @@ class TestScenarioStore:
         assert get_active_scenario("loc-x") is run
 
     def test_clear_removes_scenario(self):
-        from datetime import datetime, timezone
         run = ScenarioRun(
             location_id="loc-x",
             scenario_type="rush_period",
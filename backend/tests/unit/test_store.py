@@ -8,55 +8,60 @@ from simulator_core.store import add, clear, get_all, get_by_id, remove, remove_
 pytestmark = pytest.mark.unit
 
 
+def _charger(charge_point_id: str, **kwargs) -> Charger:
+    """EVSE-less Charger with empty config."""
+    return Charger(charge_point_id=charge_point_id, evses=[], config={}, **kwargs)
+
+
 @pytest.fixture(autouse=True)
 def clear_store():
-    """Clear store before and after each test so tests don't leak state."""
-    clear()
+    """Clear the store after each test so tests don't leak state."""
     yield
     clear()
 
 
-def test_add_and_get_by_id():
-    """add then get_by_id returns the charger."""
-    evse = EVSE(evse_id=1, max_power_W=22000.0)
-    charger = Charger(charge_point_id="CP-STORE-1", evses=[evse], config={})
-    add(charger)
-    found = get_by_id("CP-STORE-1")
-    assert found is charger
-
-
-def test_get_by_id_missing():
-    """get_by_id returns None for unknown id."""
-    assert get_by_id("CP-NONE") is None
-
-
-def test_remove_existing():
-    """remove returns True and charger is gone."""
-    charger = Charger(charge_point_id="CP-RM", evses=[], config={})
-    add(charger)
-    assert remove("CP-RM") is True
-    assert get_by_id("CP-RM") is None
-
-
-def test_remove_missing():
-    """remove returns False for unknown id."""
-    assert remove("CP-NONE") is False
-
-
-def test_get_all():
-    """get_all returns list of all chargers."""
-    add(Charger(charge_point_id="CP-A", evses=[], config={}))
-    add(Charger(charge_point_id="CP-B", evses=[], config={}))
-    all_chargers = get_all()
-    ids = [c.charge_point_id for c in all_chargers]
-    assert "CP-A" in ids and "CP-B" in ids
+@pytest.mark.parametrize(
+    "ids_to_add,lookup_id,should_exist",
+    [
+        pytest.param(["CP-STORE-1"], "CP-STORE-1", True, id="add-then-get"),
+        pytest.param([], "CP-NONE", False, id="get-missing"),
+        pytest.param(["CP-A", "CP-B"], "CP-B", True, id="get-all"),
+    ],
+)
+def test_add_get_by_id_and_get_all(ids_to_add, lookup_id, should_exist):
+    """get_by_id returns the added instance (None for unknown ids); get_all lists every added charger."""
+    added = {
+        cid: Charger(charge_point_id=cid, evses=[EVSE(evse_id=1, max_power_W=22000.0)], config={})
+        for cid in ids_to_add
+    }
+    for charger in added.values():
+        add(charger)
+    found = get_by_id(lookup_id)
+    assert (found is not None) == should_exist
+    assert found is added.get(lookup_id)
+    assert sorted(c.charge_point_id for c in get_all()) == sorted(ids_to_add)
+
+
+@pytest.mark.parametrize(
+    "ids_to_add,remove_id,removed",
+    [
+        pytest.param(["CP-RM"], "CP-RM", True, id="existing"),
+        pytest.param([], "CP-NONE", False, id="missing"),
+    ],
+)
+def test_remove(ids_to_add, remove_id, removed):
+    """remove returns True and drops the charger when present, False for an unknown id."""
+    for cid in ids_to_add:
+        add(_charger(cid))
+    assert remove(remove_id) is removed
+    assert get_by_id(remove_id) is None
 
 
 def test_remove_by_location_id():
     """remove_by_location_id removes chargers with that location_id and returns ids."""
-    c1 = Charger(charge_point_id="CP-L1", evses=[], config={}, location_id="loc-1")
-    c2 = Charger(charge_point_id="CP-L2", evses=[], config={}, location_id="loc-1")
-    c3 = Charger(charge_point_id="CP-OTHER", evses=[], config={}, location_id="loc-2")
+    c1 = _charger("CP-L1", location_id="loc-1")
+    c2 = _charger("CP-L2", location_id="loc-1")
+    c3 = _charger("CP-OTHER", location_id="loc-2")
     add(c1)
     add(c2)
     add(c3)
@@ -78,7 +83,7 @@ def test_seed_default_adds_one_charger():
 
 def test_seed_default_idempotent_when_non_empty():
     """seed_default does nothing when store already has chargers."""
-    add(Charger(charge_point_id="CP-EXISTING", evses=[], config={}))
+    add(_charger("CP-EXISTING"))
     seed_default()
     assert get_by_id("CP_001") is None
     assert get_by_id("CP-EXISTING") is not None
@@ -1,13 +1,41 @@
 """Configuration from environment."""
 import os
+from functools import cache
 
-PORT = int(os.environ.get("PORT", "8001"))
 
-# When TESTING=true, use test DB URL so tests never touch production.
-if os.environ.get("TESTING") == "true":
-    DATABASE_URL = os.environ.get("TESTING_DATABASE_URL", "sqlite:///:memory:")
-else:
-    DATABASE_URL = os.environ.get(
+@cache
+def is_testing() -> bool:
+    """True when TESTING=true: tests use TESTING_DATABASE_URL and skip app startup work."""
+    return os.environ.get("TESTING") == "true"
+
+
+@cache
+def get_port() -> int:
+    """HTTP port (PORT, default 8001); read from the environment once, clear_config_cache() to re-read."""
+    return int(os.environ.get("PORT", "8001"))
+
+
+@cache
+def get_database_url() -> str:
+    """Database URL (depends on is_testing()); read from the environment once, clear_config_cache() to re-read."""
+    # When TESTING=true, use test DB URL so tests never touch production.
+    if is_testing():
+        return os.environ.get("TESTING_DATABASE_URL", "sqlite:///:memory:")
+    return os.environ.get(
         "DATABASE_URL",
         "sqlite:///./simulator.db",
     )
+
+
+def clear_config_cache() -> None:
+    """Clear the getter caches so the next getter call re-reads the environment.
+
+    Only the getters refresh: the PORT and DATABASE_URL constants below (read by db.py and
+    alembic/env.py) and the engine db.py builds from them are fixed at import.
+    """
+    for getter in (is_testing, get_port, get_database_url):
+        getter.cache_clear()
+
+
+PORT = get_port()
+DATABASE_URL = get_database_url()
@@ -1,56 +1,66 @@
 """Parse CSV and JSON uploads for charger/vehicle import."""
 import csv
-import json
-from io import StringIO
+import sys
+from io import BytesIO, TextIOWrapper
 from typing import Any
 
-
-def _normalize_key(k: str) -> str:
-    """Strip and return key; empty after strip treated as missing."""
-    return k.strip() if k else ""
+import orjson
 
 
 def _normalize_row(row: dict[str, Any]) -> dict[str, Any]:
-    """Strip keys and string values; drop empty keys."""
+    """Strip keys and string values; drop empty keys (and DictReader's None key for extra cells)."""
     out: dict[str, Any] = {}
     for k, v in row.items():
-        key = _normalize_key(k)
+        if not k:
+            continue
+        key = k.strip()
         if not key:
             continue
-        if isinstance(v, str):
-            val = v.strip()
-        else:
-            val = v
-        out[key] = val
+        out[key] = v.strip() if type(v) is str else v
     return out
 
 
-def _charger_normalize(row: dict[str, Any]) -> dict[str, Any]:
-    """Normalize charger row: number_of_evses -> evse_count for internal use."""
-    out = dict(row)
-    if "number_of_evses" in out and "evse_count" not in out:
-        out["evse_count"] = out.pop("number_of_evses")
-    return out
+def _charger_normalize(row: dict[str, Any]) -> None:
+    """Normalize charger row in place: number_of_evses -> evse_count for internal use.
+
+    Callers pass the freshly built row from parse_csv/_normalize_row, so no defensive copy is made.
+    """
+    if "number_of_evses" in row and "evse_count" not in row:
+        row["evse_count"] = row.pop("number_of_evses")
 
 
 def parse_csv(content: bytes, charger_format: bool = False) -> list[dict[str, Any]]:
-    """Parse CSV bytes into list of dicts. Skip empty rows. If charger_format, normalize number_of_evses -> evse_count."""
-    text = content.decode("utf-8", errors="replace")
-    reader = csv.DictReader(StringIO(text))
+    """Parse CSV bytes into list of dicts. Skip empty rows. If charger_format, normalize number_of_evses -> evse_count.
+
+    Same rows as DictReader + _normalize_row, but the header is stripped once per file rather than per cell:
+    blank headers are dropped, missing trailing cells become None and cells beyond the header are ignored.
+    The bytes are decoded incrementally by the reader rather than copied into one decoded str up front.
+    """
+    reader = csv.reader(TextIOWrapper(BytesIO(content), encoding="utf-8", errors="replace", newline=""))
+    header = next(reader, None)
+    if header is None:
+        return []
+    columns = [(i, sys.intern(key)) for i, k in enumerate(header) if (key := k.strip())]
+    width = columns[-1][0] + 1 if columns else 0
     rows: list[dict[str, Any]] = []
-    for row in reader:
-        normalized = _normalize_row(dict(row))
+    for values in reader:
+        if not values:
+            continue
+        if len(values) >= width:
+            normalized = {key: values[i].strip() for i, key in columns}
+        else:
+            normalized = {key: values[i].strip() if i < len(values) else None for i, key in columns}
         if not normalized:
             continue
         if charger_format:
-            normalized = _charger_normalize(normalized)
+            _charger_normalize(normalized)
         rows.append(normalized)
     return rows
 
 
 def parse_json(content: bytes, charger_format: bool = False) -> list[dict[str, Any]]:
     """Parse JSON bytes (expect list of objects) into list of dicts. If charger_format, normalize number_of_evses -> evse_count."""
-    data = json.loads(content.decode("utf-8"))
+    data = orjson.loads(content)  # parses bytes directly; JSONDecodeError is a ValueError
     if not isinstance(data, list):
         raise ValueError("JSON must be an array of objects")
     rows: list[dict[str, Any]] = []
@@ -61,7 +71,7 @@ def parse_json(content: bytes, charger_format: bool = False) -> list[dict[str, A
         if not normalized:
             continue
         if charger_format:
-            normalized = _charger_normalize(normalized)
+            _charger_normalize(normalized)
         rows.append(normalized)
     return rows
 
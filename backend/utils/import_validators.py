@@ -1,10 +1,11 @@
 """Validate charger and vehicle rows for import."""
+from enum import IntEnum
 from typing import Any
 
 from sqlalchemy.orm import Session
 
-from repositories.charger_repository import get_charger_by_charge_point_id
-from repositories.vehicle_repository import get_vehicle_by_id_tag, get_vehicle_by_name
+from repositories.charger_repository import get_existing_charge_point_ids
+from repositories.vehicle_repository import get_existing_id_tags, get_existing_vehicle_names
 
 # Charger import defaults (per spec)
 CHARGER_DEFAULT_VENDOR = "FastCharge"
@@ -16,6 +17,49 @@ CHARGER_DEFAULT_POWER_TYPE = "DC"
 VALID_POWER_TYPES = {"AC", "DC"}
 
 
+class ImportErrorCode(IntEnum):
+    """Why an import row was rejected; rendered to text by format_import_error."""
+
+    CONNECTION_URL_REQUIRED = 1
+    CHARGER_NAME_REQUIRED = 2
+    CHARGE_POINT_ID_REQUIRED = 3
+    EVSE_COUNT_INVALID = 4
+    DUPLICATE_CHARGE_POINT_ID = 5
+    POWER_TYPE_INVALID = 6
+    NAME_REQUIRED = 7
+    ID_TAG_REQUIRED = 8
+    BATTERY_REQUIRED = 9
+    BATTERY_NOT_NUMERIC = 10
+    BATTERY_NOT_POSITIVE = 11
+    DUPLICATE_VEHICLE_NAME = 12
+    DUPLICATE_ID_TAG = 13
+    DUPLICATE_VEHICLE = 14
+
+
+_ERROR_TEMPLATES: dict[ImportErrorCode, str] = {
+    ImportErrorCode.CONNECTION_URL_REQUIRED: "connection_url is required",
+    ImportErrorCode.CHARGER_NAME_REQUIRED: "charger_name is required",
+    ImportErrorCode.CHARGE_POINT_ID_REQUIRED: "charge_point_id is required",
+    ImportErrorCode.EVSE_COUNT_INVALID: "number_of_evses must be a positive integer",
+    ImportErrorCode.DUPLICATE_CHARGE_POINT_ID: "charger already exists with charge_point_id '{}'",
+    ImportErrorCode.POWER_TYPE_INVALID: "power_type must be 'AC' or 'DC', got '{}'",
+    ImportErrorCode.NAME_REQUIRED: "name is required",
+    ImportErrorCode.ID_TAG_REQUIRED: "idTag is required (comma-separated for multiple)",
+    ImportErrorCode.BATTERY_REQUIRED: "battery_capacity_kWh is required",
+    ImportErrorCode.BATTERY_NOT_NUMERIC: "battery_capacity_kWh must be numeric",
+    ImportErrorCode.BATTERY_NOT_POSITIVE: "battery_capacity_kWh must be positive",
+    ImportErrorCode.DUPLICATE_VEHICLE_NAME: "vehicle with name '{}' already exists",
+    ImportErrorCode.DUPLICATE_ID_TAG: "vehicle with idTag '{}' already exists",
+    ImportErrorCode.DUPLICATE_VEHICLE: "vehicle with that name or idTag already exists",
+}
+
+
+def format_import_error(code: ImportErrorCode, args: tuple[Any, ...] = ()) -> str:
+    """Render a validator (code, args) pair as the message reported for a failed row."""
+    template = _ERROR_TEMPLATES[code]
+    return template.format(*args) if args else template
+
+
 def _get_str(row: dict[str, Any], key: str) -> str | None:
     """Get string value; empty string treated as missing."""
     v = row.get(key)
@@ -26,27 +70,50 @@ def _get_str(row: dict[str, Any], key: str) -> str | None:
 
 
 def _get_positive_int(row: dict[str, Any], key: str) -> int | None:
-    """Get positive integer from row; return None if missing or invalid."""
+    """Get positive integer from row; return None if missing or invalid (booleans are not counts)."""
     v = row.get(key)
-    if v is None:
+    if v is None or isinstance(v, bool):
         return None
+    if isinstance(v, int):
+        # JSON numbers arrive as int already; only strings/floats need conversion.
+        return v if v >= 1 else None
     try:
-        n = int(v) if not isinstance(v, int) else v
-        return n if n >= 1 else None
+        n = int(v)
     except (TypeError, ValueError):
         return None
+    return n if n >= 1 else None
+
+
+def _parse_id_tags(raw: str | None) -> list[str]:
+    """Split comma-separated idTags: strip, drop empty, deduplicate (order kept)."""
+    return list(dict.fromkeys(t.strip() for t in (raw or "").split(",") if t and t.strip()))
+
+
+def existing_charge_point_ids(rows: list[dict[str, Any]], db: Session) -> set[str]:
+    """charge_point_ids referenced by rows that already exist in the DB (one query per import)."""
+    return get_existing_charge_point_ids(db, {cp_id for row in rows if (cp_id := _get_str(row, "charge_point_id"))})
+
+
+def existing_vehicle_keys(rows: list[dict[str, Any]], db: Session) -> tuple[set[str], set[str]]:
+    """(names, id_tags) referenced by rows that already exist in the DB (one query each per import)."""
+    names = {name for row in rows if (name := _get_str(row, "name"))}
+    id_tags = {tag for row in rows for tag in _parse_id_tags(_get_str(row, "idTag"))}
+    return get_existing_vehicle_names(db, names), get_existing_id_tags(db, id_tags)
 
 
 def validate_charger_row(
     row: dict[str, Any],
     location_id: str,
-    db: Session,
+    existing_cp_ids: set[str],
     default_connection_url: str | None = None,
-) -> tuple[bool, dict[str, Any] | None, str]:
+) -> tuple[bool, dict[str, Any] | None, ImportErrorCode | None, tuple[Any, ...]]:
     """
-    Validate a charger row. Returns (ok, normalized_dict, error_message).
+    Validate a charger row. Returns (ok, normalized_dict, error_code, error_args); error_code is None
+    when ok, otherwise format_import_error(error_code, error_args) gives the message.
     If ok is True, normalized_dict is ready for repo_create_charger (with evse_count, etc.).
     When connection_url is missing, default_connection_url is used if provided (non-empty).
+    existing_cp_ids: charge_point_ids already taken (see existing_charge_point_ids); callers add
+    each imported id so later rows in the same upload see it.
     """
     connection_url = _get_str(row, "connection_url")
     if not connection_url and default_connection_url and str(default_connection_url).strip():
@@ -54,27 +121,27 @@ def validate_charger_row(
     charger_name = _get_str(row, "charger_name")
     charge_point_id = _get_str(row, "charge_point_id")
     if not connection_url:
-        return False, None, "connection_url is required"
+        return False, None, ImportErrorCode.CONNECTION_URL_REQUIRED, ()
     if not charger_name:
-        return False, None, "charger_name is required"
+        return False, None, ImportErrorCode.CHARGER_NAME_REQUIRED, ()
     if not charge_point_id:
-        return False, None, "charge_point_id is required"
+        return False, None, ImportErrorCode.CHARGE_POINT_ID_REQUIRED, ()
 
     evse_count = _get_positive_int(row, "evse_count")
     if evse_count is None and row.get("evse_count") is not None:
-        return False, None, "number_of_evses must be a positive integer"
+        return False, None, ImportErrorCode.EVSE_COUNT_INVALID, ()
     if evse_count is None:
         evse_count = CHARGER_DEFAULT_EVSE_COUNT
 
-    if get_charger_by_charge_point_id(db, charge_point_id) is not None:
-        return False, None, f"charger already exists with charge_point_id '{charge_point_id}'"
+    if charge_point_id in existing_cp_ids:
+        return False, None, ImportErrorCode.DUPLICATE_CHARGE_POINT_ID, (charge_point_id,)
 
     # Validate power_type
     power_type_raw = _get_str(row, "power_type")
     if power_type_raw:
         power_type = power_type_raw.upper()
         if power_type not in VALID_POWER_TYPES:
-            return False, None, f"power_type must be 'AC' or 'DC', got '{power_type_raw}'"
+            return False, None, ImportErrorCode.POWER_TYPE_INVALID, (power_type_raw,)
     else:
         power_type = CHARGER_DEFAULT_POWER_TYPE
 
@@ -89,46 +156,47 @@ def validate_charger_row(
         "ocpp_version": _get_str(row, "ocpp_version") or CHARGER_DEFAULT_OCPP,
         "power_type": power_type,
     }
-    return True, normalized, ""
+    return True, normalized, None, ()
 
 
-def validate_vehicle_row(row: dict[str, Any], db: Session) -> tuple[bool, dict[str, Any] | None, str]:
+def validate_vehicle_row(
+    row: dict[str, Any],
+    existing_names: set[str],
+    existing_id_tags: set[str],
+) -> tuple[bool, dict[str, Any] | None, ImportErrorCode | None, tuple[Any, ...]]:
     """
-    Validate a vehicle row. Returns (ok, normalized_dict, error_message).
+    Validate a vehicle row. Returns (ok, normalized_dict, error_code, error_args) like validate_charger_row.
     idTag is comma-separated; normalized_dict has name, id_tags (list[str]), battery_capacity_kwh (float).
+    existing_names / existing_id_tags: values already taken (see existing_vehicle_keys); callers add
+    each imported vehicle's name and tags so later rows in the same upload see them.
     """
     name = _get_str(row, "name")
     id_tag_raw = _get_str(row, "idTag")
     if not name:
-        return False, None, "name is required"
-    # Parse comma-separated idTags: split, strip, drop empty, deduplicate
-    id_tags = list(
-        dict.fromkeys(
-            t.strip() for t in (id_tag_raw or "").split(",") if t and t.strip()
-        )
-    )
+        return False, None, ImportErrorCode.NAME_REQUIRED, ()
+    id_tags = _parse_id_tags(id_tag_raw)
     if not id_tags:
-        return False, None, "idTag is required (comma-separated for multiple)"
+        return False, None, ImportErrorCode.ID_TAG_REQUIRED, ()
 
     raw_battery = row.get("battery_capacity_kWh")
     if raw_battery is None or (isinstance(raw_battery, str) and not raw_battery.strip()):
-        return False, None, "battery_capacity_kWh is required"
+        return False, None, ImportErrorCode.BATTERY_REQUIRED, ()
     try:
         battery = float(raw_battery)
     except (TypeError, ValueError):
-        return False, None, "battery_capacity_kWh must be numeric"
+        return False, None, ImportErrorCode.BATTERY_NOT_NUMERIC, ()
     if battery <= 0:
-        return False, None, "battery_capacity_kWh must be positive"
+        return False, None, ImportErrorCode.BATTERY_NOT_POSITIVE, ()
 
-    if get_vehicle_by_name(db, name) is not None:
-        return False, None, f"vehicle with name '{name}' already exists"
+    if name in existing_names:
+        return False, None, ImportErrorCode.DUPLICATE_VEHICLE_NAME, (name,)
     for tag in id_tags:
-        if get_vehicle_by_id_tag(db, tag) is not None:
-            return False, None, f"vehicle with idTag '{tag}' already exists"
+        if tag in existing_id_tags:
+            return False, None, ImportErrorCode.DUPLICATE_ID_TAG, (tag,)
 
     normalized = {
         "name": name,
         "id_tags": id_tags,
         "battery_capacity_kwh": battery,
     }
-    return True, normalized, ""
+    return True, normalized, None, ()